@@ -8,17 +8,36 @@ A lightweight AI OS assistant that transforms natural language into executable s
 import os
 import sys
 import json
+import atexit
+import functools
 import time
 import threading
 import subprocess
 import logging
-import speech_recognition as sr
-import pyttsx3
+import logging.handlers
+import queue
+import re
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any
-import argparse
-import traceback
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+# (year, day of year) and the matching YYYYMMDD string, reformatted only when the day rolls over
+_cached_day = [None, None]
+
+def _today_str() -> str:
+    """Return today's date as YYYYMMDD"""
+    now = time.localtime()
+    day = (now.tm_year, now.tm_yday)
+    if day != _cached_day[0]:
+        _cached_day[0] = day
+        _cached_day[1] = time.strftime('%Y%m%d', now)
+    return _cached_day[1]
 
 class SmartOSCore:
     """Core SmartOS functionality for natural language processing and system control"""
@@ -26,16 +45,22 @@ class SmartOSCore:
     def __init__(self, config_path: str = "config.json"):
         self.config = self._load_config(config_path)
         self.setup_logging()
-        self.voice_engine = None
-        self.speech_recognizer = None
+        self._voice_lock = threading.Lock()
+        self._voice_engine = None
+        self._speech_recognizer = None
+        self._microphone = None
+        self._calibration_thread = None
+        self._vosk_model = None
+        self._tts_q = queue.Queue()
+        self._tts_thread = None
+        self._tts_ready = threading.Event()
         self.command_history = []
         self.execution_metrics = {
             "total_commands": 0,
             "successful_commands": 0,
             "failed_commands": 0,
-            "average_response_time": 0.0
+            "_sum_time": 0.0
         }
-        self._initialize_voice_components()
         
     def _load_config(self, config_path: str) -> Dict:
         """Load configuration from JSON file"""
@@ -49,7 +74,9 @@ class SmartOSCore:
             ],
             "fallback_mode": True,
             "screenshot_on_error": True,
-            "background_execution": True
+            "background_execution": True,
+            "streaming_recognition": False,
+            "vosk_model_path": "models/vosk"
         }
         
         if os.path.exists(config_path):
@@ -63,46 +90,177 @@ class SmartOSCore:
         return default_config
     
     def setup_logging(self):
-        """Initialize logging system"""
+        """Initialize logging system; file and console writes happen on a background listener thread"""
+        self._log_listener = None
+        self._console_handler = None
+        self.logger = logging.getLogger("SmartOS")
+        
+        # Like basicConfig, leave an already configured root logger alone
+        if logging.getLogger().handlers:
+            return
+        
         log_dir = Path("logs")
         log_dir.mkdir(exist_ok=True)
         
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        file_handler = logging.FileHandler(log_dir / f"smartos_{_today_str()}.log")
+        stream_handler = logging.StreamHandler(sys.stdout)
+        file_handler.setFormatter(formatter)
+        stream_handler.setFormatter(formatter)
+        
+        log_queue = queue.Queue(-1)
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        # Records are only pre-rendered to their message here; the listener's handlers add the prefix
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))
+        
+        self._console_handler = stream_handler
+        self._log_listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+        self._log_listener.start()
+        atexit.register(self._log_listener.stop)
+        
         logging.basicConfig(
             level=getattr(logging, self.config["log_level"]),
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_dir / f"smartos_{datetime.now().strftime('%Y%m%d')}.log"),
-                logging.StreamHandler(sys.stdout)
-            ]
+            handlers=[queue_handler]
         )
-        self.logger = logging.getLogger("SmartOS")
     
-    def _initialize_voice_components(self):
-        """Initialize voice recognition and TTS components"""
-        if not self.config["voice_enabled"]:
-            return
-            
+    def set_console_stream(self, stream):
+        """Send console log output to stream, e.g. stderr while stdout carries machine-readable output"""
+        if self._console_handler is not None:
+            self._console_handler.setStream(stream)
+    
+    @property
+    def voice_engine(self):
+        """TTS engine, created on first use by the background TTS thread that drives it"""
+        if self._voice_engine is None and self.config["voice_enabled"]:
+            self._start_tts_thread()
+            self._tts_ready.wait()
+        return self._voice_engine
+    
+    @property
+    def speech_recognizer(self):
+        """Speech recognizer, initialized together with the microphone on first use"""
+        if self._speech_recognizer is None and self.config["voice_enabled"]:
+            with self._voice_lock:
+                if self._speech_recognizer is None and self.config["voice_enabled"]:
+                    self._initialize_speech_recognition()
+        return self._speech_recognizer
+    
+    @property
+    def microphone(self):
+        """Microphone source, initialized on first use"""
+        if self._microphone is None and self.config["voice_enabled"]:
+            with self._voice_lock:
+                if self._microphone is None and self.config["voice_enabled"]:
+                    self._initialize_speech_recognition()
+        return self._microphone
+    
+    @property
+    def vosk_model(self):
+        """VOSK model for streaming recognition, loaded on first use"""
+        if self._vosk_model is None and self.config["streaming_recognition"]:
+            with self._voice_lock:
+                if self._vosk_model is None and self.config["streaming_recognition"]:
+                    self._initialize_vosk_model()
+        return self._vosk_model
+    
+    def _initialize_tts_engine(self):
+        """Initialize TTS engine"""
         try:
-            # Initialize TTS engine
-            self.voice_engine = pyttsx3.init()
-            voices = self.voice_engine.getProperty('voices')
+            import pyttsx3
+            engine = pyttsx3.init()
+            voices = engine.getProperty('voices')
             if voices:
-                self.voice_engine.setProperty('voice', voices[0].id)
-            self.voice_engine.setProperty('rate', 180)
+                engine.setProperty('voice', voices[0].id)
+            engine.setProperty('rate', 180)
+            self._voice_engine = engine
+            
+            self.logger.info("TTS engine initialized successfully")
+        
+        except Exception as e:
+            self.logger.error(f"Voice initialization failed: {e}")
+            self.config["voice_enabled"] = False
+    
+    def _initialize_speech_recognition(self):
+        """Initialize speech recognition and calibrate for ambient noise in the background"""
+        try:
+            import speech_recognition as sr
+            recognizer = sr.Recognizer()
+            microphone = sr.Microphone()
             
-            # Initialize speech recognition
-            self.speech_recognizer = sr.Recognizer()
-            self.microphone = sr.Microphone()
+            self._calibration_thread = threading.Thread(
+                target=self._adjust_for_ambient_noise, args=(recognizer, microphone), daemon=True
+            )
+            self._calibration_thread.start()
             
-            # Adjust for ambient noise
-            with self.microphone as source:
-                self.speech_recognizer.adjust_for_ambient_noise(source, duration=1)
-                
-            self.logger.info("Voice components initialized successfully")
+            self._speech_recognizer = recognizer
+            self._microphone = microphone
             
+            self.logger.info("Speech recognition initialized successfully")
+        
         except Exception as e:
             self.logger.error(f"Voice initialization failed: {e}")
             self.config["voice_enabled"] = False
+    
+    def _initialize_vosk_model(self):
+        """Load the local VOSK model used for streaming recognition"""
+        try:
+            from vosk import Model
+            self._vosk_model = Model(self.config["vosk_model_path"])
+            
+            self.logger.info("Streaming recognition model loaded successfully")
+        
+        except Exception as e:
+            self.logger.error(f"Streaming recognition unavailable, using standard recognition: {e}")
+            self.config["streaming_recognition"] = False
+    
+    def _adjust_for_ambient_noise(self, recognizer, microphone):
+        """Adjust the recognizer's energy threshold for ambient noise"""
+        try:
+            with microphone as source:
+                recognizer.adjust_for_ambient_noise(source, duration=1)
+        except Exception as e:
+            self.logger.error(f"Ambient noise calibration failed: {e}")
+    
+    def say(self, text: str):
+        """Queue text to be spoken by the background TTS thread"""
+        self._start_tts_thread()
+        self._tts_q.put(text)
+    
+    def _start_tts_thread(self):
+        """Start the background TTS thread if it is not running yet"""
+        if self._tts_thread is None:
+            with self._voice_lock:
+                if self._tts_thread is None:
+                    self._tts_thread = threading.Thread(target=self._tts_worker, daemon=True)
+                    self._tts_thread.start()
+    
+    def _tts_worker(self):
+        """Create the TTS engine, then speak queued text one utterance at a time"""
+        # pyttsx3 drivers (NSSpeechSynthesizer on macOS) expect runAndWait on the thread that created the engine
+        if self.config["voice_enabled"]:
+            self._initialize_tts_engine()
+        self._tts_ready.set()
+        engine = self._voice_engine
+        
+        while True:
+            text = self._tts_q.get()
+            try:
+                if engine is not None:
+                    engine.say(text)
+                    engine.runAndWait()
+            except Exception as e:
+                self.logger.error(f"Speech output failed: {e}")
+            finally:
+                self._tts_q.task_done()
+    
+    def tts_wait(self):
+        """Block until all queued speech has been spoken"""
+        self._tts_q.join()
+    
+    def wait_for_calibration(self):
+        """Block until ambient noise calibration has finished"""
+        if self._calibration_thread is not None:
+            self._calibration_thread.join()
 
 class NLUProcessor:
     """Natural Language Understanding processor for command interpretation"""
@@ -110,6 +268,26 @@ class NLUProcessor:
     def __init__(self, core: SmartOSCore):
         self.core = core
         self.intent_patterns = self._load_intent_patterns()
+        self._intent_rules = self._build_intent_rules()
+        self._flat_patterns = self._build_flat_patterns()
+        self._all_patterns = tuple(sorted({
+            pattern
+            for _, keywords, targets, _ in self._intent_rules
+            for pattern in keywords + tuple(alias for _, aliases in targets for alias in aliases)
+        }))
+        # Every known pattern that is a prefix of (or equal to) each pattern
+        self._prefix_patterns = {
+            pattern: tuple(other for other in self._all_patterns if pattern.startswith(other))
+            for pattern in self._all_patterns
+        }
+        # translate() table deleting every character that starts some pattern
+        self._first_char_table = dict.fromkeys(ord(pattern[0]) for pattern in self._all_patterns)
+        self._pattern_groups = self._build_pattern_groups()
+        self._ac = self._build_automaton()
+        # The word following a standalone "file"/"document" is taken as the file name
+        self._fname_re = re.compile(r'(?<!\S)(?:file|document)\s+(\S+)', re.I)
+        # Per-instance memo of parsed commands, keyed on the raw command string
+        self._parse_cached = functools.lru_cache(maxsize=256)(self._parse)
     
     def _load_intent_patterns(self) -> Dict:
         """Load predefined intent patterns for command recognition"""
@@ -151,74 +329,142 @@ class NLUProcessor:
             }
         }
     
+    def _build_intent_rules(self) -> tuple:
+        """Flatten intent patterns into (action, keywords, targets, confidence) rules in priority order"""
+        patterns = self.intent_patterns
+        content_keywords = tuple(dict.fromkeys(
+            word for keyword in patterns["content_creation"]["keywords"] for word in keyword.split()
+        ))
+        return (
+            ("open_application", tuple(patterns["open_application"]["keywords"]),
+             tuple((app, tuple(sorted(aliases, key=len, reverse=True)))
+                   for app, aliases in patterns["open_application"]["apps"].items()), 0.9),
+            ("file_operation", tuple(patterns["file_operations"]["keywords"]),
+             tuple((action, tuple(aliases)) for action, aliases in patterns["file_operations"]["actions"].items()), 0.8),
+            ("system_control", tuple(patterns["system_control"]["keywords"]),
+             tuple((keyword, (keyword,)) for keyword in patterns["system_control"]["keywords"]), 0.85),
+            ("content_creation", content_keywords,
+             tuple((content_type, (content_type,)) for content_type in patterns["content_creation"]["types"]), 0.75),
+        )
+    
+    def _build_flat_patterns(self) -> tuple:
+        """Flatten intent rules into (action, target, alias, confidence, word_re) rows in priority order.
+        
+        Each category's keyword rows (target None) come before its target rows. Application aliases
+        carry a word-boundary regex so that e.g. "ps" does not match inside "tips".
+        """
+        rows = []
+        for action, keywords, targets, confidence in self._intent_rules:
+            rows.extend((action, None, keyword, confidence, None) for keyword in keywords)
+            for target, aliases in targets:
+                for alias in aliases:
+                    word_re = None
+                    if action == "open_application":
+                        word_re = re.compile(r'\b' + re.escape(alias) + r'\b')
+                    rows.append((action, target, alias, confidence, word_re))
+        return tuple(rows)
+    
+    def _build_pattern_groups(self) -> tuple:
+        """Compile each category's patterns into one regex, paired with their first characters for prefiltering"""
+        groups = []
+        for _, keywords, targets, _ in self._intent_rules:
+            patterns = set(keywords + tuple(alias for _, aliases in targets for alias in aliases))
+            # A lookahead finds the longest pattern starting at every position, overlaps included;
+            # shorter patterns starting at the same position are recovered from _prefix_patterns
+            alternation = "|".join(re.escape(pattern) for pattern in sorted(patterns, key=len, reverse=True))
+            groups.append((frozenset(pattern[0] for pattern in patterns), re.compile(f"(?=({alternation}))")))
+        return tuple(groups)
+    
+    def _build_automaton(self):
+        """Compile every keyword and alias into a single Aho-Corasick automaton"""
+        if not HAS_AHOCORASICK:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for pattern in self._all_patterns:
+            automaton.add_word(pattern, pattern)
+        automaton.make_automaton()
+        return automaton
+    
+    def _find_patterns(self, command_lower: str) -> set:
+        """Return every known keyword/alias occurring as a substring of the command"""
+        if self._ac is not None:
+            return {pattern for _, pattern in self._ac.iter(command_lower)}
+        
+        # A category can only match if the command contains one of its patterns' first characters
+        chars = set(command_lower)
+        matches = set()
+        for first_chars, pattern_re in self._pattern_groups:
+            if chars.isdisjoint(first_chars):
+                continue
+            for found in pattern_re.findall(command_lower):
+                matches.update(self._prefix_patterns[found])
+        return matches
+    
     def parse_command(self, command: str) -> Dict[str, Any]:
         """Parse natural language command into structured intent"""
-        command_lower = command.lower().strip()
-        
-        intent = {
-            "action": "unknown",
-            "target": "",
-            "parameters": {},
-            "confidence": 0.0,
+        action, target, parameters, confidence = self._parse_cached(command)
+        return {
+            "action": action,
+            "target": target,
+            "parameters": dict(parameters),
+            "confidence": confidence,
             "original_command": command
         }
+    
+    def _parse(self, command: str) -> tuple:
+        """Parse a command into an immutable (action, target, parameters, confidence) tuple.
         
-        # Application opening detection
-        for keyword in self.intent_patterns["open_application"]["keywords"]:
-            if keyword in command_lower:
-                intent["action"] = "open_application"
-                for app, aliases in self.intent_patterns["open_application"]["apps"].items():
-                    if any(alias in command_lower for alias in aliases):
-                        intent["target"] = app
-                        intent["confidence"] = 0.9
-                        break
+        Results are memoized per command string by _parse_cached, so this must stay free of side effects.
+        """
+        command_lower = command.lower().strip()
+        
+        # No keyword is shorter than three characters, and none can match without its first character;
+        # if translate() deletes nothing, the command contains no pattern's first character
+        if (len(command_lower) < 3
+                or len(command_lower.translate(self._first_char_table)) == len(command_lower)):
+            return ("unknown", "", (), 0.0)
+        
+        matches = self._find_patterns(command_lower)
+        
+        # Categories are checked in priority order; the first one whose keywords match wins
+        action = None
+        intent_target = ""
+        intent_confidence = 0.0
+        for category, target, alias, confidence, word_re in self._flat_patterns:
+            if action is not None and category != action:
+                break
+            if alias not in matches:
+                continue
+            if word_re is not None and not word_re.search(command_lower):
+                continue
+            if target is None:
+                action = category
+            elif category == action:
+                intent_target = target
+                intent_confidence = confidence
                 break
         
-        # File operations detection
-        if intent["action"] == "unknown":
-            for keyword in self.intent_patterns["file_operations"]["keywords"]:
-                if keyword in command_lower:
-                    intent["action"] = "file_operation"
-                    for action, aliases in self.intent_patterns["file_operations"]["actions"].items():
-                        if any(alias in command_lower for alias in aliases):
-                            intent["target"] = action
-                            intent["confidence"] = 0.8
-                            # Extract file name/path if present
-                            if "file" in command_lower or "document" in command_lower:
-                                words = command.split()
-                                for i, word in enumerate(words):
-                                    if word.lower() in ["file", "document"] and i + 1 < len(words):
-                                        intent["parameters"]["filename"] = words[i + 1]
-                                        break
-                            break
-                    break
+        if action is None:
+            return ("unknown", "", (), 0.0)
+        if not intent_target:
+            return (action, "", (), 0.0)
         
-        # System control detection
-        if intent["action"] == "unknown":
-            for keyword in self.intent_patterns["system_control"]["keywords"]:
-                if keyword in command_lower:
-                    intent["action"] = "system_control"
-                    intent["target"] = keyword
-                    intent["confidence"] = 0.85
-                    break
+        parameters = ()
         
-        # Content creation detection
-        if intent["action"] == "unknown":
-            for keyword in self.intent_patterns["content_creation"]["keywords"]:
-                if any(k in command_lower for k in keyword.split()):
-                    intent["action"] = "content_creation"
-                    for content_type in self.intent_patterns["content_creation"]["types"]:
-                        if content_type in command_lower:
-                            intent["target"] = content_type
-                            intent["confidence"] = 0.75
-                            # Extract topic if present
-                            if "about" in command_lower:
-                                topic_start = command_lower.find("about") + 5
-                                intent["parameters"]["topic"] = command[topic_start:].strip()
-                            break
-                    break
+        # Extract file name/path if present
+        if action == "file_operation":
+            match = self._fname_re.search(command)
+            if match:
+                parameters = (("filename", match.group(1)),)
         
-        return intent
+        # Extract topic if present
+        elif action == "content_creation":
+            if "about" in command_lower:
+                topic_start = command_lower.find("about") + 5
+                parameters = (("topic", command[topic_start:].strip()),)
+        
+        return (action, intent_target, parameters, intent_confidence)
 
 class TaskExecutor:
     """Execute system tasks based on parsed intents"""
@@ -227,37 +473,38 @@ class TaskExecutor:
         self.core = core
         self.app_commands = self._get_app_commands()
     
-    def _get_app_commands(self) -> Dict[str, str]:
-        """Platform-specific application launch commands"""
+    def _get_app_commands(self) -> Dict[str, List[str]]:
+        """Platform-specific application launch commands, pre-split into argument lists"""
         if sys.platform.startswith('win'):
+            # "start" and the "code" batch wrapper need cmd.exe; everything else is launched directly
             return {
-                "notepad": "notepad.exe",
-                "calculator": "calc.exe",
-                "browser": "start chrome",
-                "explorer": "explorer.exe",
-                "cmd": "cmd.exe",
-                "powershell": "powershell.exe",
-                "code": "code",
-                "word": "winword.exe",
-                "excel": "excel.exe"
+                "notepad": ["notepad.exe"],
+                "calculator": ["calc.exe"],
+                "browser": ["cmd", "/c", "start", "chrome"],
+                "explorer": ["explorer.exe"],
+                "cmd": ["cmd.exe"],
+                "powershell": ["powershell.exe"],
+                "code": ["cmd", "/c", "code"],
+                "word": ["winword.exe"],
+                "excel": ["excel.exe"]
             }
         elif sys.platform.startswith('darwin'):  # macOS
             return {
-                "notepad": "open -a TextEdit",
-                "calculator": "open -a Calculator",
-                "browser": "open -a Safari",
-                "explorer": "open -a Finder",
-                "cmd": "open -a Terminal",
-                "code": "code",
+                "notepad": ["open", "-a", "TextEdit"],
+                "calculator": ["open", "-a", "Calculator"],
+                "browser": ["open", "-a", "Safari"],
+                "explorer": ["open", "-a", "Finder"],
+                "cmd": ["open", "-a", "Terminal"],
+                "code": ["code"],
             }
         else:  # Linux
             return {
-                "notepad": "gedit",
-                "calculator": "gnome-calculator",
-                "browser": "firefox",
-                "explorer": "nautilus",
-                "cmd": "gnome-terminal",
-                "code": "code",
+                "notepad": ["gedit"],
+                "calculator": ["gnome-calculator"],
+                "browser": ["firefox"],
+                "explorer": ["nautilus"],
+                "cmd": ["gnome-terminal"],
+                "code": ["code"],
             }
     
     def execute_intent(self, intent: Dict[str, Any]) -> Dict[str, Any]:
@@ -307,10 +554,7 @@ class TaskExecutor:
             }
         
         try:
-            if sys.platform.startswith('win'):
-                subprocess.Popen(command, shell=True)
-            else:
-                subprocess.Popen(command.split())
+            subprocess.Popen(command)
             
             return {
                 "success": True,
@@ -429,19 +673,34 @@ class SmartOSInterface:
         self.nlu = NLUProcessor(self.core)
         self.executor = TaskExecutor(self.core)
         self.running = False
+        self.voice_mode = False
+        self._log_dir = Path("execution_logs")
+        self._log_dir.mkdir(exist_ok=True)
+        self._current_log_day = None
+        self._current_log_path = None
+        self._log_handle = None
+        atexit.register(self.close_execution_log)
         
     def start_voice_loop(self):
         """Start the voice interaction loop"""
-        if not self.core.config["voice_enabled"]:
+        # Opening the microphone starts ambient noise calibration; the TTS engine loads meanwhile
+        if self.core.microphone is None or self.core.voice_engine is None:
             self.core.logger.warning("Voice not enabled, falling back to text mode")
             return self.start_text_loop()
         
+        # Calibrate before the greeting, or the noise baseline includes the assistant's own voice
+        self.core.wait_for_calibration()
+        
+        self.voice_mode = True
         self.core.logger.info("SmartOS Voice Assistant started. Say 'exit' to quit.")
         self.speak("SmartOS Voice Assistant is ready. How can I help you?")
         
         self.running = True
         while self.running:
             try:
+                # Commands run while the reply is spoken, but listening waits for
+                # it to finish, or the microphone would pick up the assistant itself
+                self.core.tts_wait()
                 command = self.listen_for_command()
                 if command:
                     if command.lower() in ["exit", "quit", "stop"]:
@@ -453,9 +712,12 @@ class SmartOSInterface:
             except KeyboardInterrupt:
                 self.speak("Goodbye!")
                 break
-            except Exception as e:
+            except (OSError, subprocess.SubprocessError) as e:
                 self.core.logger.error(f"Voice loop error: {e}")
                 self.speak("Sorry, I encountered an error. Please try again.")
+        
+        # Let the final response finish before the daemon TTS thread is torn down
+        self.core.tts_wait()
     
     def start_text_loop(self):
         """Start the text-based interaction loop"""
@@ -475,17 +737,30 @@ class SmartOSInterface:
                 
                 self.process_command(command)
                 
-            except KeyboardInterrupt:
+            # Ctrl-C, Ctrl-D or the end of piped input
+            except (KeyboardInterrupt, EOFError):
                 print("\nGoodbye!")
                 break
-            except Exception as e:
+            except (OSError, subprocess.SubprocessError) as e:
                 self.core.logger.error(f"Text loop error: {e}")
                 print("Sorry, I encountered an error. Please try again.")
     
     def listen_for_command(self) -> Optional[str]:
         """Listen for voice command"""
+        if self.core.config["streaming_recognition"] and self.core.vosk_model is not None:
+            return self._listen_streaming()
+        
+        # The microphone is None when speech_recognition is missing, so check before importing it
+        microphone = self.core.microphone
+        if microphone is None:
+            return None
+        
+        import speech_recognition as sr
+        
         try:
-            with self.core.microphone as source:
+            self.core.wait_for_calibration()
+            
+            with microphone as source:
                 print("Listening...")
                 audio = self.core.speech_recognizer.listen(source, timeout=5, phrase_time_limit=10)
             
@@ -499,59 +774,121 @@ class SmartOSInterface:
         except sr.UnknownValueError:
             print("Could not understand audio")
             return None
-        except Exception as e:
+        except (sr.RequestError, OSError) as e:
+            self.core.logger.error(f"Speech recognition error: {e}")
+            return None
+    
+    def _listen_streaming(self, rate: int = 16000, phrase_time_limit: float = 10) -> Optional[str]:
+        """Listen for voice command, recognizing 100ms audio chunks while they are still being captured"""
+        import pyaudio
+        from vosk import KaldiRecognizer
+        
+        chunk_frames = rate // 10
+        recognizer = KaldiRecognizer(self.core.vosk_model, rate)
+        chunks = queue.Queue()
+        stop = threading.Event()
+        
+        try:
+            audio = pyaudio.PyAudio()
+        except OSError as e:
+            self.core.logger.error(f"Speech recognition error: {e}")
+            return None
+        stream = None
+        
+        def capture():
+            try:
+                while not stop.is_set():
+                    chunks.put(stream.read(chunk_frames, exception_on_overflow=False))
+            except OSError as e:
+                self.core.logger.error(f"Audio capture error: {e}")
+                stop.set()
+        
+        capture_thread = threading.Thread(target=capture, daemon=True)
+        try:
+            stream = audio.open(format=pyaudio.paInt16, channels=1, rate=rate,
+                                input=True, frames_per_buffer=chunk_frames)
+            print("Listening...")
+            capture_thread.start()
+            
+            # Return on the first final result instead of waiting for the whole phrase window
+            deadline = time.time() + phrase_time_limit
+            while time.time() < deadline and not stop.is_set():
+                try:
+                    data = chunks.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+                if recognizer.AcceptWaveform(data):
+                    command = json.loads(recognizer.Result()).get("text", "")
+                    if command:
+                        print(f"Heard: {command}")
+                        return command
+            
+            command = json.loads(recognizer.FinalResult()).get("text", "")
+            if not command:
+                print("Could not understand audio")
+                return None
+            print(f"Heard: {command}")
+            return command
+        
+        except OSError as e:
             self.core.logger.error(f"Speech recognition error: {e}")
             return None
+        finally:
+            # PortAudio is released even when the stream failed to open
+            stop.set()
+            if stream is not None:
+                capture_thread.join()
+                stream.stop_stream()
+                stream.close()
+            audio.terminate()
     
     def speak(self, text: str):
-        """Text-to-speech output"""
-        if self.core.voice_engine:
-            self.core.voice_engine.say(text)
-            self.core.voice_engine.runAndWait()
+        """Text-to-speech output, spoken in the background"""
+        if self.core.config["voice_enabled"]:
+            self.core.say(text)
         print(f"SmartOS: {text}")
     
     def process_command(self, command: str):
         """Process and execute a command"""
         self.core.logger.info(f"Processing command: {command}")
+        start_time = time.time()
         
         # Parse the command
         intent = self.nlu.parse_command(command)
         self.core.logger.info(f"Parsed intent: {intent}")
         
         if intent["confidence"] < 0.5:
+            # Not executed, but still counted and logged so the metrics cover every command
             response = f"I'm not sure how to handle: '{command}'. Could you rephrase?"
-            if self.core.config["voice_enabled"]:
-                self.speak(response)
+            result = {
+                "success": False,
+                "message": response,
+                "execution_time": time.time() - start_time,
+                "reason": "low_confidence"
+            }
+        else:
+            # Execute the command
+            result = self.executor.execute_intent(intent)
+            
+            if result["success"]:
+                response = result["message"]
             else:
-                print(f"SmartOS: {response}")
-            return
-        
-        # Execute the command
-        result = self.executor.execute_intent(intent)
+                response = f"Failed to execute command: {result.get('message', 'Unknown error')}"
         
-        # Update metrics
-        self.core.execution_metrics["total_commands"] += 1
+        # Update metrics; the average response time is derived in get_metrics()
+        metrics = self.core.execution_metrics
+        metrics["total_commands"] += 1
         if result["success"]:
-            self.core.execution_metrics["successful_commands"] += 1
+            metrics["successful_commands"] += 1
         else:
-            self.core.execution_metrics["failed_commands"] += 1
-        
-        # Calculate average response time
-        total_time = (self.core.execution_metrics["average_response_time"] * 
-                     (self.core.execution_metrics["total_commands"] - 1) + 
-                     result["execution_time"])
-        self.core.execution_metrics["average_response_time"] = total_time / self.core.execution_metrics["total_commands"]
+            metrics["failed_commands"] += 1
+        metrics["_sum_time"] += result["execution_time"]
         
         # Log the result
         self.log_execution_result(command, intent, result)
         
         # Provide feedback
-        if result["success"]:
-            response = result["message"]
-        else:
-            response = f"Failed to execute command: {result.get('message', 'Unknown error')}"
-        
-        if self.core.config["voice_enabled"]:
+        if self.voice_mode:
             self.speak(response)
         else:
             print(f"SmartOS: {response}")
@@ -566,29 +903,46 @@ class SmartOSInterface:
             "execution_time": result["execution_time"]
         }
         
-        # Save to JSON log
-        log_dir = Path("execution_logs")
-        log_dir.mkdir(exist_ok=True)
-        
-        log_file = log_dir / f"execution_{datetime.now().strftime('%Y%m%d')}.json"
-        
-        if log_file.exists():
-            with open(log_file, 'r') as f:
-                logs = json.load(f)
-        else:
-            logs = []
-        
-        logs.append(log_entry)
+        # Append to JSON Lines log, switching files when the day rolls over
+        today = _today_str()
+        if today != self._current_log_day:
+            self.close_execution_log()
+            self._current_log_day = today
+            self._current_log_path = self._log_dir / f"execution_{today}.jsonl"
+            # Line buffered, so every entry reaches the file as soon as it is written
+            self._log_handle = open(self._current_log_path, 'a', buffering=1)
         
-        with open(log_file, 'w') as f:
-            json.dump(logs, f, indent=2)
+        self._log_handle.write(json.dumps(log_entry) + '\n')
+    
+    def close_execution_log(self):
+        """Close the open execution log file, if any"""
+        if self._log_handle is not None:
+            self._log_handle.close()
+            self._log_handle = None
     
     def get_metrics(self) -> Dict:
         """Get current execution metrics"""
-        return self.core.execution_metrics.copy()
+        metrics = self.core.execution_metrics.copy()
+        sum_time = metrics.pop("_sum_time")
+        metrics["average_response_time"] = (
+            sum_time / metrics["total_commands"] if metrics["total_commands"] else 0.0
+        )
+        return metrics
+
+def load_execution_log(log_file) -> List[Dict]:
+    """Load all entries from a JSON Lines execution log"""
+    entries = []
+    with open(log_file, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                entries.append(json.loads(line))
+    return entries
 
 def main():
     """Main entry point"""
+    import argparse
+    
     parser = argparse.ArgumentParser(description="SmartOS - AI Operating System Assistant")
     parser.add_argument("--mode", choices=["voice", "text"], default="voice",
                        help="Interaction mode (voice or text)")
@@ -600,15 +954,20 @@ def main():
     try:
         # Initialize SmartOS
         smart_os = SmartOSInterface()
-        
+    except Exception as e:
+        print(f"Failed to start SmartOS: {e}")
+        sys.exit(1)
+    
+    try:
         # Start appropriate interface
         if args.mode == "voice":
             smart_os.start_voice_loop()
         else:
             smart_os.start_text_loop()
-            
-    except Exception as e:
-        print(f"Failed to start SmartOS: {e}")
+    
+    # Expected errors are handled inside the loops; anything reaching here is a bug
+    except Exception:
+        smart_os.core.logger.exception("SmartOS terminated by an unexpected error")
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -7,25 +7,206 @@ Provides comprehensive metrics visualization and real-time monitoring
 import json
 import time
 import os
+import mmap
+import shutil
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterable, Iterator
+from collections import deque
+from collections.abc import Sized
 import threading
+import string
+import itertools
+import bisect
+from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import logging
+import logging.handlers
+import queue
+import atexit
+import importlib.util
 
 try:
-    import matplotlib.pyplot as plt
-    import matplotlib.dates as mdates
-    from matplotlib.animation import FuncAnimation
-    HAS_MATPLOTLIB = True
+    import orjson
+    HAS_ORJSON = True
 except ImportError:
-    HAS_MATPLOTLIB = False
+    HAS_ORJSON = False
 
-try:
-    import pandas as pd
-    HAS_PANDAS = True
-except ImportError:
-    HAS_PANDAS = False
+# pandas and numpy only serve large batches; check they are installed without paying for the import
+HAS_PANDAS = importlib.util.find_spec("pandas") is not None
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+# Both accept bytes; orjson parses several times faster than the stdlib
+_json_loads = orjson.loads if HAS_ORJSON else json.loads
+
+# Response time bucket edges in seconds, and the batch size from which numpy bucketing pays off
+_RESPONSE_BINS = (1.0, 3.0, 5.0)
+NUMPY_MIN_RECORDS = 512
+
+# Batch size from which a pandas groupby beats per-record dict updates for the category breakdown
+PANDAS_MIN_RECORDS = 5000
+
+# Below this many log files, reading them sequentially beats starting a worker pool
+PARALLEL_MIN_FILES = 8
+
+# Coarsest directory mtime resolution to expect (HFS+, some network filesystems)
+MTIME_GRANULARITY_NS = 1_000_000_000
+
+def _parse_timestamp(timestamp_str: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO 8601 record timestamp, returning None if it is missing or malformed"""
+    if not timestamp_str:
+        return None
+    try:
+        if timestamp_str.endswith('Z'):
+            timestamp_str = timestamp_str[:-1] + '+00:00'
+        return datetime.fromisoformat(timestamp_str)
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+def _lazy_import(name: str):
+    """Import an optional dependency on first use; if it is installed but broken, clear its HAS_ flag and return None"""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        globals()[f"HAS_{name.upper()}"] = False
+        return None
+
+def _bucket_response_times(response_times: List[float]):
+    """Count response times into the cumulative under_1s/under_3s/under_5s buckets and over_5s"""
+    np = _lazy_import("numpy") if HAS_NUMPY and len(response_times) >= NUMPY_MIN_RECORDS else None
+    if np is not None:
+        # side='right' puts a time equal to an edge in the slower bucket, matching the < comparisons below
+        indices = np.searchsorted(_RESPONSE_BINS, np.asarray(response_times, dtype=np.float64), side='right')
+        counts = np.bincount(indices, minlength=4).tolist()
+        return counts[0], counts[0] + counts[1], counts[0] + counts[1] + counts[2], counts[3]
+    
+    under_1s = under_3s = under_5s = over_5s = 0
+    for execution_time in response_times:
+        if execution_time < 1.0:
+            under_1s += 1
+        if execution_time < 3.0:
+            under_3s += 1
+        if execution_time < 5.0:
+            under_5s += 1
+        else:
+            over_5s += 1
+    return under_1s, under_3s, under_5s, over_5s
+
+def _success_flags(success_through: List[int]) -> List[int]:
+    """Recover per-record success flags from running success counts"""
+    return [current - previous for previous, current in zip([0] + success_through[:-1], success_through)]
+
+@dataclass
+class PartialStats:
+    """Metric counters aggregated over one batch of execution records"""
+    total: int = 0
+    success: int = 0
+    correct_intents: int = 0
+    response_time_sum: float = 0.0
+    response_time_count: int = 0
+    under_1s: int = 0
+    under_3s: int = 0
+    under_5s: int = 0
+    over_5s: int = 0
+    categories: Dict[str, int] = field(default_factory=dict)
+    category_success: Dict[str, int] = field(default_factory=dict)
+    category_time: Dict[str, float] = field(default_factory=dict)
+    # Naive record timestamps in ascending order; success_through[i] counts successes in timestamps[:i + 1]
+    timestamps: List[datetime] = field(default_factory=list)
+    success_through: List[int] = field(default_factory=list)
+    
+    def extend(self, other: "PartialStats"):
+        """Fold the counters of a later batch from the same log into this one"""
+        self.total += other.total
+        self.success += other.success
+        self.correct_intents += other.correct_intents
+        self.response_time_sum += other.response_time_sum
+        self.response_time_count += other.response_time_count
+        self.under_1s += other.under_1s
+        self.under_3s += other.under_3s
+        self.under_5s += other.under_5s
+        self.over_5s += other.over_5s
+        for category, count in other.categories.items():
+            self.categories[category] = self.categories.get(category, 0) + count
+            self.category_success[category] = self.category_success.get(category, 0) + other.category_success[category]
+            self.category_time[category] = self.category_time.get(category, 0) + other.category_time[category]
+        
+        if not other.timestamps:
+            return
+        base = self.success_through[-1] if self.success_through else 0
+        if not self.timestamps or other.timestamps[0] >= self.timestamps[-1]:
+            # Appended records are normally newer than everything before them
+            self.timestamps.extend(other.timestamps)
+            self.success_through.extend(base + count for count in other.success_through)
+            return
+        
+        timed = sorted(
+            itertools.chain(zip(self.timestamps, _success_flags(self.success_through)),
+                            zip(other.timestamps, _success_flags(other.success_through))),
+            key=lambda item: item[0]
+        )
+        self.timestamps = [timestamp for timestamp, _ in timed]
+        self.success_through = list(itertools.accumulate(success for _, success in timed))
+    
+    def prune(self, cutoff: datetime):
+        """Drop timestamps before cutoff; the windows only move forward, so they are never needed again"""
+        start = bisect.bisect_left(self.timestamps, cutoff)
+        if not start:
+            return
+        dropped = self.success_through[start - 1]
+        del self.timestamps[:start]
+        self.success_through = [count - dropped for count in self.success_through[start:]]
+    
+    def window(self, cutoff: datetime):
+        """Return (records, successes) with a timestamp at or after cutoff"""
+        start = bisect.bisect_left(self.timestamps, cutoff)
+        count = len(self.timestamps) - start
+        if not count:
+            return 0, 0
+        before = self.success_through[start - 1] if start else 0
+        return count, self.success_through[-1] - before
+
+def _load_one(log_file: Path, offset: int = 0):
+    """Load one execution log file, returning (records, end offset, error).
+    
+    JSON-lines files are read from offset onward and the end offset is where the next
+    incremental read should resume; a trailing line that does not parse yet is assumed
+    to be mid-write and left for that read. Whole-file JSON logs return an end offset of None.
+    Module-level so that ProcessPoolExecutor workers can pickle it.
+    """
+    try:
+        with open(log_file, 'rb') as f:
+            if log_file.suffix == ".jsonl":
+                if os.fstat(f.fileno()).st_size <= offset:
+                    return [], offset, None
+                # Walk the lines in place through the page cache instead of copying the file into memory
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    end = max(offset, mm.rfind(b'\n', offset) + 1)
+                    records = []
+                    mm.seek(offset)
+                    while mm.tell() < end:
+                        line = mm.readline()
+                        if line.strip():
+                            records.append(_json_loads(line))
+                    tail = mm[end:]
+                if tail.strip():
+                    try:
+                        records.append(_json_loads(tail))
+                        end += len(tail)
+                    except ValueError:
+                        pass
+                return records, end, None
+            data = _json_loads(f.read())
+        return (data if isinstance(data, list) else [data]), None, None
+    except (OSError, ValueError) as e:
+        # ValueError covers the json and orjson decode errors as well as undecodable bytes
+        return None, offset, repr(e)
+
+def _resume_offset(cached_size: int, cached_end: Optional[int], stat: os.stat_result) -> int:
+    """Offset to continue reading a changed log from: its cached end if it only grew, else 0"""
+    if cached_end is not None and stat.st_size >= cached_size:
+        return cached_end
+    return 0
 
 class MetricsCollector:
     """Collect and aggregate SmartOS performance metrics"""
@@ -34,6 +215,11 @@ class MetricsCollector:
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
         self.metrics_cache = {}
+        # log file name -> (mtime_ns, size, resume offset, PartialStats)
+        self._file_cache = {}
+        # Directory mtime and log paths as of the last scan by _current_log_files
+        self._dir_mtime = -1
+        self._known_logs = []
         self.real_time_metrics = {
             "commands_per_minute": 0,
             "average_response_time": 0.0,
@@ -49,69 +235,297 @@ class MetricsCollector:
         logger = logging.getLogger("MetricsCollector")
         logger.setLevel(logging.INFO)
         
-        handler = logging.FileHandler("logs/metrics.log")
+        # The logger is process-wide; only the first collector attaches handlers
+        if logger.handlers:
+            return logger
+        
+        log_dir = Path("logs")
+        log_dir.mkdir(exist_ok=True)
+        
+        handler = logging.handlers.RotatingFileHandler(
+            log_dir / "metrics.log", maxBytes=5_000_000, backupCount=3
+        )
         formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
         handler.setFormatter(formatter)
-        logger.addHandler(handler)
         
+        # File writes happen on a listener thread so the monitor loop never blocks on disk I/O
+        log_queue = queue.Queue(-1)
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))
+        listener = logging.handlers.QueueListener(log_queue, handler)
+        listener.start()
+        atexit.register(listener.stop)
+        
+        logger.addHandler(queue_handler)
         return logger
     
-    def collect_execution_data(self) -> List[Dict]:
-        """Collect all execution data from log files"""
-        all_data = []
+    def _scan_log_files(self) -> List[tuple]:
+        """List (path, stat) for every execution_*.json and execution_*.jsonl log in one directory scan"""
+        log_files = []
+        with os.scandir(self.data_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith("execution_") and name.endswith((".json", ".jsonl")) and entry.is_file():
+                    log_files.append((Path(entry.path), entry.stat()))
+        return log_files
+    
+    def iter_execution_data(self) -> Iterator[Dict]:
+        """Yield all execution records from the log files, file by file
         
-        for log_file in self.data_dir.glob("execution_*.json"):
-            try:
-                with open(log_file, 'r') as f:
-                    data = json.load(f)
-                    if isinstance(data, list):
-                        all_data.extend(data)
-                    else:
-                        all_data.append(data)
-            except Exception as e:
-                self.logger.error(f"Error reading {log_file}: {e}")
+        Nothing is cached; only the files being loaded ahead and the one being yielded are held in memory.
+        """
+        log_files = [log_file for log_file, _ in self._scan_log_files()]
+        errors = []
+        try:
+            for log_file, (records, _, error) in zip(log_files, self._load_files(log_files)):
+                if error is not None:
+                    errors.append((log_file.name, error))
+                    continue
+                yield from records
+        finally:
+            self._log_load_errors(errors)
+    
+    def _load_files(self, log_files: List[Path]) -> Iterator[tuple]:
+        """Yield the _load_one result of each log file in order, loading large batches in parallel"""
+        if len(log_files) < PARALLEL_MIN_FILES:
+            yield from map(_load_one, log_files)
+            return
         
-        return all_data
+        # stdlib json parsing is CPU bound and needs processes to run in parallel;
+        # orjson is fast enough that threads overlapping the file reads are the better trade
+        executor_class = ThreadPoolExecutor if HAS_ORJSON else ProcessPoolExecutor
+        workers = os.cpu_count() or 1
+        with executor_class(max_workers=workers) as pool:
+            # Keep a bounded number of files in flight so loaded records never pile up ahead of the consumer
+            remaining = iter(log_files)
+            in_flight = deque(pool.submit(_load_one, log_file)
+                              for log_file in itertools.islice(remaining, 2 * workers))
+            while in_flight:
+                result = in_flight.popleft().result()
+                for log_file in itertools.islice(remaining, 1):
+                    in_flight.append(pool.submit(_load_one, log_file))
+                yield result
+    
+    def get_current_metrics(self) -> Dict[str, Any]:
+        """Calculate metrics over all logs, reparsing only the files that changed since the last call"""
+        partials = []
+        seen = set()
+        errors = []
+        for log_file, stat in self._current_log_files():
+            seen.add(log_file.name)
+            partial = self._aggregate_file(log_file, stat, errors)
+            if partial is not None:
+                partials.append(partial)
+        self._log_load_errors(errors)
+        
+        # Drop entries for log files that have been removed
+        for name in self._file_cache.keys() - seen:
+            del self._file_cache[name]
+        
+        return self._merge(partials)
+    
+    def _current_log_files(self) -> List[tuple]:
+        """Like _scan_log_files, but skip the directory listing while no log has been added or removed
+        
+        Appending to a log does not touch the directory mtime, so the known files are still
+        stat'ed. A scan of a directory modified within the mtime granularity is not trusted,
+        since a file created right after it could leave the mtime unchanged; the next call
+        scans again.
+        """
+        dir_mtime = os.stat(self.data_dir).st_mtime_ns
+        if dir_mtime == self._dir_mtime:
+            try:
+                return [(log_file, log_file.stat()) for log_file in self._known_logs]
+            except FileNotFoundError:
+                pass
+        
+        log_files = self._scan_log_files()
+        recently_modified = time.time_ns() - dir_mtime <= MTIME_GRANULARITY_NS
+        self._dir_mtime = -1 if recently_modified else dir_mtime
+        self._known_logs = [log_file for log_file, _ in log_files]
+        return log_files
+    
+    def _log_load_errors(self, errors: List[tuple]):
+        """Log (file name, error) pairs as a single entry, listing at most ten of them"""
+        if errors:
+            self.logger.error(f"Failed to read {len(errors)} log files: {errors[:10]}")
     
-    def calculate_performance_metrics(self, data: List[Dict]) -> Dict[str, Any]:
+    def calculate_performance_metrics(self, data: Iterable[Dict]) -> Dict[str, Any]:
         """Calculate comprehensive performance metrics"""
-        if not data:
-            return {}
-        
-        # Basic metrics
-        total_commands = len(data)
-        successful_commands = sum(1 for d in data if d.get('result', {}).get('success', False))
-        failed_commands = total_commands - successful_commands
-        
-        # Response time metrics
-        response_times = [d.get('execution_time', 0) for d in data if 'execution_time' in d]
-        avg_response_time = sum(response_times) / len(response_times) if response_times else 0
+        return self._merge([self._aggregate(data)])
+    
+    def _aggregate_file(self, log_file: Path, stat: os.stat_result, errors: List[tuple]) -> Optional[PartialStats]:
+        """Aggregate one log file, reusing the cached partial while its mtime and size are unchanged
+        
+        A JSON-lines log that only grew is aggregated from where the last read stopped and
+        folded into its cached partial. Load failures are appended to errors.
+        """
+        cached = self._file_cache.get(log_file.name)
+        if cached is not None and (cached[0], cached[1]) == (stat.st_mtime_ns, stat.st_size):
+            return cached[3]
+        
+        offset = _resume_offset(cached[1], cached[2], stat) if cached is not None else 0
+        records, end, error = _load_one(log_file, offset)
+        if error is not None:
+            errors.append((log_file.name, error))
+            self._file_cache.pop(log_file.name, None)
+            return None
+        
+        partial = self._aggregate(records)
+        if offset:
+            cached[3].extend(partial)
+            partial = cached[3]
+        self._file_cache[log_file.name] = (stat.st_mtime_ns, stat.st_size, end, partial)
+        return partial
+    
+    def _aggregate(self, data: Iterable[Dict]) -> PartialStats:
+        """Accumulate the counters behind every metric in a single pass over the records"""
+        stats = PartialStats()
+        categories = stats.categories
+        category_success = stats.category_success
+        category_time = stats.category_time
+        response_times = []
+        timed = []
+        
+        # A streamed iterable has no size up front and always takes the per-record path
+        use_pandas = HAS_PANDAS and isinstance(data, Sized) and len(data) >= PANDAS_MIN_RECORDS
+        pd = _lazy_import("pandas") if use_pandas else None
+        use_pandas = pd is not None
+        actions = []
+        successes = []
+        times = []
+        
+        # Counters and bound methods live in locals for the duration of the loop
+        total = success_count = correct_intents = 0
+        response_time_sum = 0.0
+        add_response_time = response_times.append
+        add_timed = timed.append
+        parse_timestamp = _parse_timestamp
         
-        # Success rate by time periods
+        for d in data:
+            # Missing or empty intent/result dicts are handled without allocating a {} default
+            intent = d.get('intent')
+            if intent:
+                action = intent.get('action', 'unknown')
+                if intent.get('confidence', 0) > 0.8:
+                    correct_intents += 1
+            else:
+                action = 'unknown'
+            result = d.get('result')
+            success = bool(result.get('success', False)) if result else False
+            
+            total += 1
+            success_count += success
+            
+            execution_time = d.get('execution_time')
+            if execution_time is not None:
+                response_time_sum += execution_time
+                add_response_time(execution_time)
+            
+            if use_pandas:
+                actions.append(action)
+                successes.append(success)
+                times.append(execution_time or 0)
+            else:
+                categories[action] = categories.get(action, 0) + 1
+                category_success[action] = category_success.get(action, 0) + success
+                category_time[action] = category_time.get(action, 0) + (execution_time or 0)
+            
+            timestamp = parse_timestamp(d.get('timestamp'))
+            # Timezone-aware timestamps cannot be compared with the local cutoffs and never fall in a window
+            if timestamp is not None and timestamp.tzinfo is None:
+                add_timed((timestamp, success))
+        
+        stats.total = total
+        stats.success = success_count
+        stats.correct_intents = correct_intents
+        stats.response_time_sum = response_time_sum
+        
+        if use_pandas:
+            frame = pd.DataFrame({'action': actions, 'success': successes, 'time': times})
+            grouped = frame.groupby('action', sort=False, dropna=False).agg(
+                total=('time', 'size'), success=('success', 'sum'), time=('time', 'sum')
+            )
+            for action, total, succeeded, time_sum in grouped.itertuples(name=None):
+                if pd.isna(action):
+                    # groupby reports a missing (None) action as NaN
+                    action = None
+                categories[action] = int(total)
+                category_success[action] = int(succeeded)
+                category_time[action] = float(time_sum)
+        
+        # Buckets are cumulative: a 0.5s command counts toward under_1s, under_3s and under_5s
+        stats.response_time_count = len(response_times)
+        stats.under_1s, stats.under_3s, stats.under_5s, stats.over_5s = _bucket_response_times(response_times)
+        
+        # Sorted timestamps plus a running success count let _merge size each window with a bisect
+        timed.sort(key=lambda item: item[0])
+        running = 0
+        for timestamp, success in timed:
+            stats.timestamps.append(timestamp)
+            running += success
+            stats.success_through.append(running)
+        
+        return stats
+    
+    def _merge(self, partials: List[PartialStats]) -> Dict[str, Any]:
+        """Combine per-file partial aggregates into the final metrics"""
         now = datetime.now()
-        last_hour = [d for d in data if self._within_timeframe(d, hours=1)]
-        last_day = [d for d in data if self._within_timeframe(d, hours=24)]
+        hour_cutoff = now - timedelta(hours=1)
+        day_cutoff = now - timedelta(hours=24)
+        
+        total_commands = 0
+        successful_commands = 0
+        correct_intents = 0
+        response_time_sum = 0.0
+        response_time_count = 0
+        under_1s = under_3s = under_5s = over_5s = 0
+        hour_total = hour_success = 0
+        day_total = day_success = 0
+        command_categories = {}
+        category_success = {}
+        category_time = {}
+        
+        for stats in partials:
+            total_commands += stats.total
+            successful_commands += stats.success
+            correct_intents += stats.correct_intents
+            response_time_sum += stats.response_time_sum
+            response_time_count += stats.response_time_count
+            under_1s += stats.under_1s
+            under_3s += stats.under_3s
+            under_5s += stats.under_5s
+            over_5s += stats.over_5s
+            
+            for category, count in stats.categories.items():
+                command_categories[category] = command_categories.get(category, 0) + count
+                category_success[category] = category_success.get(category, 0) + stats.category_success[category]
+                category_time[category] = category_time.get(category, 0) + stats.category_time[category]
+            
+            # Partials are cached across calls; keeping only the last 24h bounds their memory
+            stats.prune(day_cutoff)
+            count, succeeded = stats.window(day_cutoff)
+            day_total += count
+            day_success += succeeded
+            count, succeeded = stats.window(hour_cutoff)
+            hour_total += count
+            hour_success += succeeded
+        
+        if not total_commands:
+            return {}
         
-        # Intent accuracy
-        correct_intents = sum(1 for d in data if d.get('intent', {}).get('confidence', 0) > 0.8)
+        failed_commands = total_commands - successful_commands
+        avg_response_time = response_time_sum / response_time_count if response_time_count else 0
         intent_accuracy = (correct_intents / total_commands * 100) if total_commands > 0 else 0
         
-        # Command categories
-        command_categories = {}
-        for d in data:
-            action = d.get('intent', {}).get('action', 'unknown')
-            command_categories[action] = command_categories.get(action, 0) + 1
-        
         # Performance by category
         category_performance = {}
-        for category in command_categories:
-            category_data = [d for d in data if d.get('intent', {}).get('action') == category]
-            category_success = sum(1 for d in category_data if d.get('result', {}).get('success', False))
+        for category, category_total in command_categories.items():
             category_performance[category] = {
-                'total': len(category_data),
-                'success': category_success,
-                'success_rate': (category_success / len(category_data) * 100) if category_data else 0,
-                'avg_response_time': sum(d.get('execution_time', 0) for d in category_data) / len(category_data) if category_data else 0
+                'total': category_total,
+                'success': category_success[category],
+                'success_rate': category_success[category] / category_total * 100,
+                'avg_response_time': category_time[category] / category_total
             }
         
         return {
@@ -125,48 +539,26 @@ class MetricsCollector:
             },
             'time_based': {
                 'last_hour': {
-                    'total': len(last_hour),
-                    'success_rate': (sum(1 for d in last_hour if d.get('result', {}).get('success', False)) / len(last_hour) * 100) if last_hour else 0
+                    'total': hour_total,
+                    'success_rate': (hour_success / hour_total * 100) if hour_total else 0
                 },
                 'last_day': {
-                    'total': len(last_day),
-                    'success_rate': (sum(1 for d in last_day if d.get('result', {}).get('success', False)) / len(last_day) * 100) if last_day else 0
+                    'total': day_total,
+                    'success_rate': (day_success / day_total * 100) if day_total else 0
                 }
             },
             'categories': command_categories,
             'performance_by_category': category_performance,
             'response_time_distribution': {
-                'under_1s': sum(1 for t in response_times if t < 1.0),
-                'under_3s': sum(1 for t in response_times if t < 3.0),
-                'under_5s': sum(1 for t in response_times if t < 5.0),
-                'over_5s': sum(1 for t in response_times if t >= 5.0)
+                'under_1s': under_1s,
+                'under_3s': under_3s,
+                'under_5s': under_5s,
+                'over_5s': over_5s
             }
         }
-    
-    def _within_timeframe(self, data_point: Dict, hours: int) -> bool:
-        """Check if data point is within specified timeframe"""
-        try:
-            timestamp_str = data_point.get('timestamp', '')
-            if not timestamp_str:
-                return False
-            
-            timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-            cutoff = datetime.now() - timedelta(hours=hours)
-            return timestamp >= cutoff
-        except Exception:
-            return False
 
-class DashboardGenerator:
-    """Generate visual dashboard for SmartOS metrics"""
-    
-    def __init__(self, metrics_collector: MetricsCollector):
-        self.collector = metrics_collector
-        self.output_dir = Path("dashboard")
-        self.output_dir.mkdir(exist_ok=True)
-    
-    def generate_html_dashboard(self, metrics: Dict[str, Any]) -> str:
-        """Generate HTML dashboard"""
-        html_template = """
+# Dashboard page; CSS and JS braces are literal, values are pre-formatted strings
+_HTML_TEMPLATE = string.Template("""
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -280,31 +672,31 @@ class DashboardGenerator:
         <div class="header">
             <h1>SmartOS Metrics Dashboard</h1>
             <p>Real-time performance monitoring and analytics</p>
-            <p>Last Updated: {timestamp}</p>
+            <p>Last Updated: ${timestamp}</p>
         </div>
         
         <div class="metrics-grid">
             <div class="metric-card success">
                 <div class="metric-title">Success Rate</div>
-                <div class="metric-value">{success_rate:.1f}%</div>
+                <div class="metric-value">${success_rate}%</div>
                 <div class="metric-subtitle">Overall command success rate</div>
             </div>
             
             <div class="metric-card info">
                 <div class="metric-title">Total Commands</div>
-                <div class="metric-value">{total_commands:,}</div>
+                <div class="metric-value">${total_commands}</div>
                 <div class="metric-subtitle">Commands processed</div>
             </div>
             
             <div class="metric-card warning">
                 <div class="metric-title">Avg Response Time</div>
-                <div class="metric-value">{avg_response_time:.2f}s</div>
+                <div class="metric-value">${avg_response_time}s</div>
                 <div class="metric-subtitle">Average execution time</div>
             </div>
             
             <div class="metric-card info">
                 <div class="metric-title">Intent Accuracy</div>
-                <div class="metric-value">{intent_accuracy:.1f}%</div>
+                <div class="metric-value">${intent_accuracy}%</div>
                 <div class="metric-subtitle">Command understanding rate</div>
             </div>
         </div>
@@ -314,17 +706,17 @@ class DashboardGenerator:
             <div>
                 <label>Success Rate Target (>90%)</label>
                 <div class="progress-bar">
-                    <div class="progress-fill" style="width: {success_rate}%"></div>
+                    <div class="progress-fill" style="width: ${success_rate_width}%"></div>
                 </div>
-                <small>{success_rate:.1f}% / 90%</small>
+                <small>${success_rate}% / 90%</small>
             </div>
             
             <div>
                 <label>Fast Response Target (<3s for 80%)</label>
                 <div class="progress-bar">
-                    <div class="progress-fill" style="width: {fast_response_rate}%"></div>
+                    <div class="progress-fill" style="width: ${fast_response_width}%"></div>
                 </div>
-                <small>{fast_response_rate:.1f}% under 3 seconds</small>
+                <small>${fast_response_rate}% under 3 seconds</small>
             </div>
         </div>
         
@@ -341,7 +733,7 @@ class DashboardGenerator:
                     </tr>
                 </thead>
                 <tbody>
-                    {category_rows}
+                    ${category_rows}
                 </tbody>
             </table>
         </div>
@@ -355,12 +747,12 @@ class DashboardGenerator:
             <h3>System Health</h3>
             <div class="metrics-grid">
                 <div>
-                    <span class="status-indicator status-{health_status}"></span>
-                    <strong>Overall Health: {health_status_text}</strong>
+                    <span class="status-indicator status-${health_status}"></span>
+                    <strong>Overall Health: ${health_status_text}</strong>
                 </div>
-                <div>Success Rate: {success_rate:.1f}%</div>
-                <div>Response Time: {avg_response_time:.2f}s</div>
-                <div>Intent Accuracy: {intent_accuracy:.1f}%</div>
+                <div>Success Rate: ${success_rate}%</div>
+                <div>Response Time: ${avg_response_time}s</div>
+                <div>Intent Accuracy: ${intent_accuracy}%</div>
             </div>
         </div>
     </div>
@@ -368,54 +760,92 @@ class DashboardGenerator:
     <script>
         // Response Time Distribution Chart
         const ctx = document.getElementById('responseTimeChart').getContext('2d');
-        const responseTimeChart = new Chart(ctx, {{
+        const responseTimeChart = new Chart(ctx, {
             type: 'doughnut',
-            data: {{
+            data: {
                 labels: ['< 1s', '1-3s', '3-5s', '> 5s'],
-                datasets: [{{
-                    data: [{under_1s}, {under_1to3s}, {under_3to5s}, {over_5s}],
+                datasets: [{
+                    data: [${under_1s}, ${under_1to3s}, ${under_3to5s}, ${over_5s}],
                     backgroundColor: [
                         '#4CAF50',
                         '#8BC34A', 
                         '#FF9800',
                         '#F44336'
                     ]
-                }}]
-            }},
-            options: {{
+                }]
+            },
+            options: {
                 responsive: true,
-                plugins: {{
-                    legend: {{
+                plugins: {
+                    legend: {
                         position: 'bottom'
-                    }}
-                }}
-            }}
-        }});
+                    }
+                }
+            }
+        });
         
         // Auto-refresh every 30 seconds
-        setTimeout(function() {{
+        setTimeout(function() {
             location.reload();
-        }}, 30000);
+        }, 30000);
     </script>
 </body>
 </html>
-"""
-        
+""")
+
+def _compile_template(template: string.Template):
+    """Split a template into its static UTF-8 chunks and the placeholder names between them"""
+    literals = []
+    names = []
+    position = 0
+    for match in template.pattern.finditer(template.template):
+        name = match.group('named') or match.group('braced')
+        if name is None:
+            raise ValueError(f"Unsupported template token {match.group()!r}")
+        literals.append(template.template[position:match.start()].encode('utf-8'))
+        names.append(name)
+        position = match.end()
+    literals.append(template.template[position:].encode('utf-8'))
+    return literals, names
+
+# The template is scanned once at import; rendering only interleaves the chunks with values
+_HTML_LITERALS, _HTML_FIELDS = _compile_template(_HTML_TEMPLATE)
+
+def _render_html(values: Dict[str, Any]) -> List[bytes]:
+    """Render the dashboard page as a list of UTF-8 chunks, ready for writelines"""
+    parts = []
+    for literal, name in zip(_HTML_LITERALS, _HTML_FIELDS):
+        parts.append(literal)
+        parts.append(str(values[name]).encode('utf-8'))
+    parts.append(_HTML_LITERALS[-1])
+    return parts
+
+class DashboardGenerator:
+    """Generate visual dashboard for SmartOS metrics"""
+    
+    def __init__(self, metrics_collector: MetricsCollector):
+        self.collector = metrics_collector
+        self.output_dir = Path("dashboard")
+        self.output_dir.mkdir(exist_ok=True)
+    
+    def generate_html_dashboard(self, metrics: Dict[str, Any]) -> List[bytes]:
+        """Generate HTML dashboard as a list of UTF-8 chunks"""
         # Calculate additional metrics
         overview = metrics.get('overview', {})
         response_dist = metrics.get('response_time_distribution', {})
         categories = metrics.get('performance_by_category', {})
         
-        fast_response_rate = ((response_dist.get('under_1s', 0) + response_dist.get('under_3s', 0)) / 
+        # under_3s already includes under_1s
+        fast_response_rate = (response_dist.get('under_3s', 0) / 
                              overview.get('total_commands', 1) * 100) if overview.get('total_commands', 0) > 0 else 0
         
         # Generate category rows
-        category_rows = ""
+        rows = []
         for category, perf in categories.items():
             status = "success" if perf['success_rate'] > 80 else "warning" if perf['success_rate'] > 60 else "error"
             status_text = "Good" if perf['success_rate'] > 80 else "Fair" if perf['success_rate'] > 60 else "Poor"
             
-            category_rows += f"""
+            rows.append(f"""
             <tr>
                 <td>{category.replace('_', ' ').title()}</td>
                 <td>{perf['total']}</td>
@@ -423,7 +853,8 @@ class DashboardGenerator:
                 <td>{perf['avg_response_time']:.2f}s</td>
                 <td><span class="status-indicator status-{status}"></span>{status_text}</td>
             </tr>
-            """
+            """)
+        category_rows = "".join(rows)
         
         # Overall health status
         success_rate = overview.get('success_rate', 0)
@@ -431,13 +862,15 @@ class DashboardGenerator:
         health_status_text = "Excellent" if success_rate > 90 else "Good" if success_rate > 80 else "Fair" if success_rate > 60 else "Poor"
         
         # Fill template
-        html_content = html_template.format(
+        html_content = _render_html(dict(
             timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            success_rate=overview.get('success_rate', 0),
-            total_commands=overview.get('total_commands', 0),
-            avg_response_time=overview.get('average_response_time', 0),
-            intent_accuracy=overview.get('intent_accuracy', 0),
-            fast_response_rate=fast_response_rate,
+            success_rate=f"{success_rate:.1f}",
+            success_rate_width=success_rate,
+            total_commands=f"{overview.get('total_commands', 0):,}",
+            avg_response_time=f"{overview.get('average_response_time', 0):.2f}",
+            intent_accuracy=f"{overview.get('intent_accuracy', 0):.1f}",
+            fast_response_rate=f"{fast_response_rate:.1f}",
+            fast_response_width=fast_response_rate,
             category_rows=category_rows,
             health_status=health_status,
             health_status_text=health_status_text,
@@ -445,21 +878,28 @@ class DashboardGenerator:
             under_1to3s=response_dist.get('under_3s', 0) - response_dist.get('under_1s', 0),
             under_3to5s=response_dist.get('under_5s', 0) - response_dist.get('under_3s', 0),
             over_5s=response_dist.get('over_5s', 0)
-        )
+        ))
         
         return html_content
     
-    def save_dashboard(self, html_content: str) -> str:
+    def save_dashboard(self, html_content: List[bytes]) -> str:
         """Save HTML dashboard to file"""
         dashboard_file = self.output_dir / f"smartos_dashboard_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
         
-        with open(dashboard_file, 'w') as f:
-            f.write(html_content)
-        
-        # Also save as latest
         latest_file = self.output_dir / "smartos_dashboard_latest.html"
-        with open(latest_file, 'w') as f:
-            f.write(html_content)
+        
+        # Write once, swap it in as latest atomically, then link the timestamped copy to it
+        tmp_file = self.output_dir / f".dashboard.{os.getpid()}.tmp"
+        with open(tmp_file, 'wb', buffering=1 << 20) as f:
+            # The chunks go straight into the file buffer without being joined into one page first
+            f.writelines(html_content)
+        os.replace(tmp_file, latest_file)
+        
+        try:
+            os.link(latest_file, dashboard_file)
+        except OSError:
+            # No hard link support (or the name exists from a save in the same second)
+            shutil.copyfile(latest_file, dashboard_file)
         
         return str(dashboard_file)
 
@@ -469,16 +909,16 @@ class RealTimeMonitor:
     def __init__(self, metrics_collector: MetricsCollector):
         self.collector = metrics_collector
         self.dashboard_generator = DashboardGenerator(metrics_collector)
-        self.monitoring = False
+        self._stop = threading.Event()
         self.monitor_thread = None
         self.update_interval = 60  # seconds
     
     def start_monitoring(self):
         """Start real-time monitoring"""
-        if self.monitoring:
+        if self.monitor_thread is not None and self.monitor_thread.is_alive():
             return
         
-        self.monitoring = True
+        self._stop.clear()
         self.monitor_thread = threading.Thread(target=self._monitor_loop)
         self.monitor_thread.daemon = True
         self.monitor_thread.start()
@@ -487,35 +927,34 @@ class RealTimeMonitor:
     
     def stop_monitoring(self):
         """Stop real-time monitoring"""
-        self.monitoring = False
+        self._stop.set()
         if self.monitor_thread:
             self.monitor_thread.join()
+            self.monitor_thread = None
         
         print("Real-time monitoring stopped")
     
     def _monitor_loop(self):
         """Main monitoring loop"""
-        while self.monitoring:
+        while not self._stop.is_set():
             try:
-                # Collect latest data
-                execution_data = self.collector.collect_execution_data()
-                
-                # Calculate metrics
-                metrics = self.collector.calculate_performance_metrics(execution_data)
+                # Calculate metrics (only changed log files are reparsed)
+                metrics = self.collector.get_current_metrics()
+                total_commands = metrics.get('overview', {}).get('total_commands', 0)
                 
                 # Generate dashboard
                 html_content = self.dashboard_generator.generate_html_dashboard(metrics)
                 dashboard_file = self.dashboard_generator.save_dashboard(html_content)
                 
                 # Log metrics
-                self.collector.logger.info(f"Metrics updated: {len(execution_data)} commands processed")
+                self.collector.logger.info(f"Metrics updated: {total_commands} commands processed")
                 
-                # Wait for next update
-                time.sleep(self.update_interval)
+                # Wait for next update; returns early once stop_monitoring is called
+                self._stop.wait(self.update_interval)
                 
             except Exception as e:
                 self.collector.logger.error(f"Monitoring error: {e}")
-                time.sleep(self.update_interval)
+                self._stop.wait(self.update_interval)
 
 def main():
     """Main dashboard generator"""
@@ -529,18 +968,15 @@ def main():
     
     try:
         # Collect current data
-        print("Collecting execution data...")
-        execution_data = collector.collect_execution_data()
-        print(f"Found {len(execution_data)} execution records")
+        # Records are streamed straight into the aggregation rather than collected into one list
+        print("Collecting execution data and calculating performance metrics...")
+        metrics = collector.calculate_performance_metrics(collector.iter_execution_data())
+        print(f"Found {metrics.get('overview', {}).get('total_commands', 0)} execution records")
         
-        if not execution_data:
+        if not metrics:
             print("No execution data found. Run SmartOS commands first to generate metrics.")
             return
         
-        # Calculate metrics
-        print("Calculating performance metrics...")
-        metrics = collector.calculate_performance_metrics(execution_data)
-        
         # Generate dashboard
         print("Generating HTML dashboard...")
         html_content = dashboard_gen.generate_html_dashboard(metrics)
@@ -8,14 +8,54 @@ import json
 import time
 import os
 import sys
+import functools
+from enum import IntEnum
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Dict, Any, Callable
 import unittest
 from smartos_main import SmartOSInterface, SmartOSCore, NLUProcessor, TaskExecutor
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+def _json_line(obj: Any) -> str:
+    """Serialize obj as one compact line of JSON, newline included"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE).decode()
+    return json.dumps(obj, separators=(",", ":")) + "\n"
+
+def _json_indented(obj: Any) -> bytes:
+    """Serialize obj as JSON indented by two spaces"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+# Difficulty tiers and expected actions, interned once and shared by every test case and result
+EASY, MEDIUM, HARD = map(sys.intern, ("easy", "medium", "hard"))
+OPEN_APPLICATION, FILE_OPERATION, CONTENT_CREATION, SYSTEM_CONTROL = map(
+    sys.intern, ("open_application", "file_operation", "content_creation", "system_control")
+)
+
+class Tier(IntEnum):
+    """Difficulty tier as a small int, used to index per-tier counters"""
+    EASY = 0
+    MEDIUM = 1
+    HARD = 2
+
+# Results keep the difficulty label; metrics map it to a tier index with one lookup
+TIER_BY_DIFFICULTY = {EASY: Tier.EASY, MEDIUM: Tier.MEDIUM, HARD: Tier.HARD}
+
 class SmartOSTestCase:
     """Individual test case for SmartOS evaluation"""
     
+    # No per-instance __dict__; attribute reads go through slot descriptors
+    __slots__ = ("name", "description", "command", "expected_action", "difficulty",
+                 "expected_success", "result", "execution_time", "screenshot", "error")
+    
     def __init__(self, name: str, description: str, command: str, 
                  expected_action: str, difficulty: str, expected_success: bool = True):
         self.name = name
@@ -29,12 +69,86 @@ class SmartOSTestCase:
         self.screenshot = None
         self.error = None
 
+# Tier 1: Easy (40% = 20 test cases)
+_TIER1_CASES = (
+    SmartOSTestCase("T1_01", "Open Notepad", "open notepad", OPEN_APPLICATION, EASY),
+    SmartOSTestCase("T1_02", "Launch Calculator", "start calculator", OPEN_APPLICATION, EASY),
+    SmartOSTestCase("T1_03", "Open Browser", "launch browser", OPEN_APPLICATION, EASY),
+    SmartOSTestCase("T1_04", "Start File Explorer", "open explorer", OPEN_APPLICATION, EASY),
+    SmartOSTestCase("T1_05", "Open Command Prompt", "start cmd", OPEN_APPLICATION, EASY),
+    SmartOSTestCase("T1_06", "Launch PowerShell", "open powershell", OPEN_APPLICATION, EASY),
+    SmartOSTestCase("T1_07", "Start VS Code", "launch code", OPEN_APPLICATION, EASY),
+    SmartOSTestCase("T1_08", "Open Word", "start word", OPEN_APPLICATION, EASY),
+    SmartOSTestCase("T1_09", "Launch Excel", "open excel", OPEN_APPLICATION, EASY),
+    SmartOSTestCase("T1_10", "Create New File", "create file test.txt", FILE_OPERATION, EASY),
+    SmartOSTestCase("T1_11", "Write to File", "write content to document.txt", FILE_OPERATION, EASY),
+    SmartOSTestCase("T1_12", "Open Text Editor", "start text editor", OPEN_APPLICATION, EASY),
+    SmartOSTestCase("T1_13", "Launch File Manager", "open file manager", OPEN_APPLICATION, EASY),
+    SmartOSTestCase("T1_14", "Start Terminal", "open terminal", OPEN_APPLICATION, EASY),
+    SmartOSTestCase("T1_15", "Create Document", "create document report.txt", FILE_OPERATION, EASY),
+    SmartOSTestCase("T1_16", "Open Internet", "launch internet", OPEN_APPLICATION, EASY),
+    SmartOSTestCase("T1_17", "Start Console", "open console", OPEN_APPLICATION, EASY),
+    SmartOSTestCase("T1_18", "Launch Calc", "run calc", OPEN_APPLICATION, EASY),
+    SmartOSTestCase("T1_19", "Open Files", "start files", OPEN_APPLICATION, EASY),
+    SmartOSTestCase("T1_20", "Run Browser", "run browser", OPEN_APPLICATION, EASY),
+)
+
+# Tier 2: Medium (40% = 20 test cases)
+_TIER2_CASES = (
+    SmartOSTestCase("T2_01", "Create and Edit File", "create file essay.txt and write content", CONTENT_CREATION, MEDIUM),
+    SmartOSTestCase("T2_02", "Write Essay", "write essay about technology", CONTENT_CREATION, MEDIUM),
+    SmartOSTestCase("T2_03", "Create Document with Topic", "create document about artificial intelligence", CONTENT_CREATION, MEDIUM),
+    SmartOSTestCase("T2_04", "Write Report", "write report about climate change", CONTENT_CREATION, MEDIUM),
+    SmartOSTestCase("T2_05", "Compose Letter", "compose letter about job application", CONTENT_CREATION, MEDIUM),
+    SmartOSTestCase("T2_06", "Create Multiple Files", "create file notes.txt and also create backup.txt", FILE_OPERATION, MEDIUM),
+    SmartOSTestCase("T2_07", "Open App and Create File", "open notepad and create new document", OPEN_APPLICATION, MEDIUM),
+    SmartOSTestCase("T2_08", "Write and Save Content", "write essay about education and save it", CONTENT_CREATION, MEDIUM),
+    SmartOSTestCase("T2_09", "Complex File Operation", "create folder documents and add file readme.txt", FILE_OPERATION, MEDIUM),
+    SmartOSTestCase("T2_10", "Multi-step Application", "launch calculator then open notepad", OPEN_APPLICATION, MEDIUM),
+    SmartOSTestCase("T2_11", "Content with Specifications", "write document about programming with examples", CONTENT_CREATION, MEDIUM),
+    SmartOSTestCase("T2_12", "File Management Task", "create file data.txt and copy it to backup.txt", FILE_OPERATION, MEDIUM),
+    SmartOSTestCase("T2_13", "System Information Task", "open system information and create summary", SYSTEM_CONTROL, MEDIUM),
+    SmartOSTestCase("T2_14", "Scheduled Task", "create reminder document for meeting tomorrow", CONTENT_CREATION, MEDIUM),
+    SmartOSTestCase("T2_15", "Application with Parameters", "open browser and navigate to search", OPEN_APPLICATION, MEDIUM),
+    SmartOSTestCase("T2_16", "Document Processing", "create report and format it properly", CONTENT_CREATION, MEDIUM),
+    SmartOSTestCase("T2_17", "File Organization", "create project folder and add files", FILE_OPERATION, MEDIUM),
+    SmartOSTestCase("T2_18", "Multi-format Content", "write essay in both text and document format", CONTENT_CREATION, MEDIUM),
+    SmartOSTestCase("T2_19", "System Configuration", "open settings and create configuration notes", SYSTEM_CONTROL, MEDIUM),
+    SmartOSTestCase("T2_20", "Complex Command Chain", "open explorer, create folder, and add readme file", FILE_OPERATION, MEDIUM),
+)
+
+# Tier 3: Hard (20% = 10 test cases)
+_TIER3_CASES = (
+    SmartOSTestCase("T3_01", "Build and Deploy Project", "create project structure, write code, and prepare deployment", CONTENT_CREATION, HARD),
+    SmartOSTestCase("T3_02", "System Automation Task", "automate file backup process and create schedule", SYSTEM_CONTROL, HARD),
+    SmartOSTestCase("T3_03", "Multi-application Workflow", "open multiple apps, create documents, and organize workspace", OPEN_APPLICATION, HARD),
+    SmartOSTestCase("T3_04", "Complex Content Generation", "write comprehensive report with research, analysis, and recommendations", CONTENT_CREATION, HARD),
+    SmartOSTestCase("T3_05", "System Integration Task", "integrate file system with applications and create automation", SYSTEM_CONTROL, HARD),
+    SmartOSTestCase("T3_06", "Advanced File Management", "organize entire project directory with proper structure and documentation", FILE_OPERATION, HARD),
+    SmartOSTestCase("T3_07", "Multi-step System Task", "configure system settings, create backup, and document process", SYSTEM_CONTROL, HARD),
+    SmartOSTestCase("T3_08", "Complex Application Suite", "set up development environment with multiple tools and configurations", OPEN_APPLICATION, HARD),
+    SmartOSTestCase("T3_09", "Comprehensive Documentation", "create complete project documentation with examples and guides", CONTENT_CREATION, HARD),
+    SmartOSTestCase("T3_10", "Full System Workflow", "execute complete workflow from planning to implementation and testing", SYSTEM_CONTROL, HARD),
+)
+
+# The full catalog, built once at import; test cases are never mutated, so every suite shares it
+TEST_CASES = _TIER1_CASES + _TIER2_CASES + _TIER3_CASES
+
 class SmartOSTestSuite:
     """Complete test suite for SmartOS evaluation"""
     
-    def __init__(self):
-        self.test_cases = self._generate_test_cases()
+    def __init__(self, export_xlsx: bool = False, progress: str = "text"):
+        self.test_cases = TEST_CASES
+        self.export_xlsx = export_xlsx
+        # Per-test progress output: "text", "json" (one JSON object per line) or "quiet"
+        self.progress = progress
         self.results = []
+        self.results_dir = Path("test_results")
+        self._run_timestamp = None
+        # (total, passed) per Tier, filled in by _calculate_metrics for the report
+        self._tier_counts = [(0, 0)] * len(Tier)
+        # command -> parsed intent; kept across run_all_tests calls, which each build a new interface
+        self._parse_cache = {}
         self.metrics = {
             "total_tests": 0,
             "passed_tests": 0,
@@ -46,99 +160,54 @@ class SmartOSTestSuite:
             "average_response_time": 0.0
         }
         
-    def _generate_test_cases(self) -> List[SmartOSTestCase]:
-        """Generate 50 test cases across 3 difficulty tiers"""
-        
-        # Tier 1: Easy (40% = 20 test cases)
-        tier1_cases = [
-            SmartOSTestCase("T1_01", "Open Notepad", "open notepad", "open_application", "easy"),
-            SmartOSTestCase("T1_02", "Launch Calculator", "start calculator", "open_application", "easy"),
-            SmartOSTestCase("T1_03", "Open Browser", "launch browser", "open_application", "easy"),
-            SmartOSTestCase("T1_04", "Start File Explorer", "open explorer", "open_application", "easy"),
-            SmartOSTestCase("T1_05", "Open Command Prompt", "start cmd", "open_application", "easy"),
-            SmartOSTestCase("T1_06", "Launch PowerShell", "open powershell", "open_application", "easy"),
-            SmartOSTestCase("T1_07", "Start VS Code", "launch code", "open_application", "easy"),
-            SmartOSTestCase("T1_08", "Open Word", "start word", "open_application", "easy"),
-            SmartOSTestCase("T1_09", "Launch Excel", "open excel", "open_application", "easy"),
-            SmartOSTestCase("T1_10", "Create New File", "create file test.txt", "file_operation", "easy"),
-            SmartOSTestCase("T1_11", "Write to File", "write content to document.txt", "file_operation", "easy"),
-            SmartOSTestCase("T1_12", "Open Text Editor", "start text editor", "open_application", "easy"),
-            SmartOSTestCase("T1_13", "Launch File Manager", "open file manager", "open_application", "easy"),
-            SmartOSTestCase("T1_14", "Start Terminal", "open terminal", "open_application", "easy"),
-            SmartOSTestCase("T1_15", "Create Document", "create document report.txt", "file_operation", "easy"),
-            SmartOSTestCase("T1_16", "Open Internet", "launch internet", "open_application", "easy"),
-            SmartOSTestCase("T1_17", "Start Console", "open console", "open_application", "easy"),
-            SmartOSTestCase("T1_18", "Launch Calc", "run calc", "open_application", "easy"),
-            SmartOSTestCase("T1_19", "Open Files", "start files", "open_application", "easy"),
-            SmartOSTestCase("T1_20", "Run Browser", "run browser", "open_application", "easy"),
-        ]
+    def run_all_tests(self, workers: int = 1) -> Dict[str, Any]:
+        """Run all test cases and generate comprehensive results
         
-        # Tier 2: Medium (40% = 20 test cases)
-        tier2_cases = [
-            SmartOSTestCase("T2_01", "Create and Edit File", "create file essay.txt and write content", "content_creation", "medium"),
-            SmartOSTestCase("T2_02", "Write Essay", "write essay about technology", "content_creation", "medium"),
-            SmartOSTestCase("T2_03", "Create Document with Topic", "create document about artificial intelligence", "content_creation", "medium"),
-            SmartOSTestCase("T2_04", "Write Report", "write report about climate change", "content_creation", "medium"),
-            SmartOSTestCase("T2_05", "Compose Letter", "compose letter about job application", "content_creation", "medium"),
-            SmartOSTestCase("T2_06", "Create Multiple Files", "create file notes.txt and also create backup.txt", "file_operation", "medium"),
-            SmartOSTestCase("T2_07", "Open App and Create File", "open notepad and create new document", "open_application", "medium"),
-            SmartOSTestCase("T2_08", "Write and Save Content", "write essay about education and save it", "content_creation", "medium"),
-            SmartOSTestCase("T2_09", "Complex File Operation", "create folder documents and add file readme.txt", "file_operation", "medium"),
-            SmartOSTestCase("T2_10", "Multi-step Application", "launch calculator then open notepad", "open_application", "medium"),
-            SmartOSTestCase("T2_11", "Content with Specifications", "write document about programming with examples", "content_creation", "medium"),
-            SmartOSTestCase("T2_12", "File Management Task", "create file data.txt and copy it to backup.txt", "file_operation", "medium"),
-            SmartOSTestCase("T2_13", "System Information Task", "open system information and create summary", "system_control", "medium"),
-            SmartOSTestCase("T2_14", "Scheduled Task", "create reminder document for meeting tomorrow", "content_creation", "medium"),
-            SmartOSTestCase("T2_15", "Application with Parameters", "open browser and navigate to search", "open_application", "medium"),
-            SmartOSTestCase("T2_16", "Document Processing", "create report and format it properly", "content_creation", "medium"),
-            SmartOSTestCase("T2_17", "File Organization", "create project folder and add files", "file_operation", "medium"),
-            SmartOSTestCase("T2_18", "Multi-format Content", "write essay in both text and document format", "content_creation", "medium"),
-            SmartOSTestCase("T2_19", "System Configuration", "open settings and create configuration notes", "system_control", "medium"),
-            SmartOSTestCase("T2_20", "Complex Command Chain", "open explorer, create folder, and add readme file", "file_operation", "medium"),
-        ]
-        
-        # Tier 3: Hard (20% = 10 test cases)
-        tier3_cases = [
-            SmartOSTestCase("T3_01", "Build and Deploy Project", "create project structure, write code, and prepare deployment", "content_creation", "hard"),
-            SmartOSTestCase("T3_02", "System Automation Task", "automate file backup process and create schedule", "system_control", "hard"),
-            SmartOSTestCase("T3_03", "Multi-application Workflow", "open multiple apps, create documents, and organize workspace", "open_application", "hard"),
-            SmartOSTestCase("T3_04", "Complex Content Generation", "write comprehensive report with research, analysis, and recommendations", "content_creation", "hard"),
-            SmartOSTestCase("T3_05", "System Integration Task", "integrate file system with applications and create automation", "system_control", "hard"),
-            SmartOSTestCase("T3_06", "Advanced File Management", "organize entire project directory with proper structure and documentation", "file_operation", "hard"),
-            SmartOSTestCase("T3_07", "Multi-step System Task", "configure system settings, create backup, and document process", "system_control", "hard"),
-            SmartOSTestCase("T3_08", "Complex Application Suite", "set up development environment with multiple tools and configurations", "open_application", "hard"),
-            SmartOSTestCase("T3_09", "Comprehensive Documentation", "create complete project documentation with examples and guides", "content_creation", "hard"),
-            SmartOSTestCase("T3_10", "Full System Workflow", "execute complete workflow from planning to implementation and testing", "system_control", "hard"),
-        ]
-        
-        return tier1_cases + tier2_cases + tier3_cases
-    
-    def run_all_tests(self) -> Dict[str, Any]:
-        """Run all test cases and generate comprehensive results"""
-        print("Starting SmartOS Test Suite...")
-        print(f"Total test cases: {len(self.test_cases)}")
+        Test cases run on up to workers threads; results are reported and stored in test
+        case order. The default of one runs them sequentially: concurrent cases skew each
+        other's response times and share GUI apps and output files.
+        """
+        out = self._text_out()
+        print("Starting SmartOS Test Suite...", file=out)
+        print(f"Total test cases: {len(self.test_cases)}", file=out)
         
         # Initialize SmartOS for testing
         try:
             smart_os = SmartOSInterface()
         except Exception as e:
-            print(f"Failed to initialize SmartOS: {e}")
+            print(f"Failed to initialize SmartOS: {e}", file=out)
             return {"error": "Initialization failed"}
         
-        # Run each test case
-        for i, test_case in enumerate(self.test_cases, 1):
-            print(f"\nRunning test {i}/{len(self.test_cases)}: {test_case.name}")
-            print(f"Description: {test_case.description}")
-            print(f"Command: {test_case.command}")
-            
-            result = self._execute_test_case(smart_os, test_case)
-            self.results.append(result)
+        if self.progress == "json":
+            # SmartOS logs to stdout by default; keep its lines out of the JSON stream
+            smart_os.core.set_console_stream(sys.stderr)
+        
+        # Results are streamed to a JSON Lines file as they come in, so a crashed run keeps its partial results
+        self.results_dir.mkdir(exist_ok=True)
+        self._run_timestamp = time.strftime("%Y%m%d_%H%M%S")
+        results_file = self.results_dir / f"smartos_test_results_{self._run_timestamp}.jsonl"
+        
+        # Bind the interface's entry points and the timeout once instead of per test
+        parse = smart_os.nlu.parse_command
+        execute_intent = smart_os.executor.execute_intent
+        timeout = smart_os.core.config["response_timeout"]
+        execute = functools.partial(self._execute_test_case, parse, execute_intent, timeout)
+        sequential = workers == 1
+        with ThreadPoolExecutor(max_workers=workers) as pool, open(results_file, 'w', buffering=1) as results_out:
+            # A single worker runs each test lazily when the loop asks for its result,
+            # so its header is out before it starts and a hanging test is visible
+            results = map(execute, self.test_cases) if sequential else pool.map(execute, self.test_cases)
             
-            # Print immediate result
-            status = "PASS" if result["success"] else "FAIL"
-            print(f"Result: {status} ({result['execution_time']:.2f}s)")
-            if not result["success"]:
-                print(f"Error: {result.get('error', 'Unknown error')}")
+            total = len(self.test_cases)
+            for i, test_case in enumerate(self.test_cases, 1):
+                if sequential:
+                    self._write_test_header(i, total, test_case)
+                result = next(results)
+                self.results.append(result)
+                results_out.write(_json_line(result))
+                
+                # Report each test as soon as it and all before it have finished
+                self._write_progress(i, total, test_case, result, header=not sequential)
         
         # Calculate metrics
         self._calculate_metrics()
@@ -151,25 +220,79 @@ class SmartOSTestSuite:
         
         return report
     
-    def _execute_test_case(self, smart_os: SmartOSInterface, test_case: SmartOSTestCase) -> Dict[str, Any]:
-        """Execute individual test case"""
-        start_time = time.time()
+    def _text_out(self):
+        """Stream for human-readable output; stderr in JSON progress mode, so stdout stays parseable"""
+        return sys.stderr if self.progress == "json" else sys.stdout
+    
+    def _progress_header(self, index: int, total: int, test_case: SmartOSTestCase) -> str:
+        """Text progress lines announcing a test"""
+        return (f"\nRunning test {index}/{total}: {test_case.name}\n"
+                f"Description: {test_case.description}\n"
+                f"Command: {test_case.command}\n")
+    
+    def _write_test_header(self, index: int, total: int, test_case: SmartOSTestCase):
+        """Announce a test before it runs; text mode only"""
+        if self.progress == "text":
+            sys.stdout.write(self._progress_header(index, total, test_case))
+            sys.stdout.flush()
+    
+    def _write_progress(self, index: int, total: int, test_case: SmartOSTestCase, result: Dict[str, Any],
+                        header: bool = True):
+        """Write the progress output for one finished test in a single write
+        
+        header is False when _write_test_header already announced the test.
+        """
+        if self.progress == "quiet":
+            return
+        
+        status = "PASS" if result["success"] else "FAIL"
+        if self.progress == "json":
+            line = _json_line({
+                "index": index,
+                "total": total,
+                "test_name": test_case.name,
+                "status": status,
+                "execution_time": result["execution_time"],
+                "error": None if result["success"] else result.get("error", "Unknown error")
+            })
+        else:
+            line = self._progress_header(index, total, test_case) if header else ""
+            line += f"Result: {status} ({result['execution_time']:.2f}s)\n"
+            if not result["success"]:
+                line += f"Error: {result.get('error', 'Unknown error')}\n"
+        sys.stdout.write(line)
+    
+    def _execute_test_case(self, parse: Callable[[str], Dict[str, Any]],
+                           execute_intent: Callable[[Dict[str, Any]], Dict[str, Any]],
+                           timeout: float, test_case: SmartOSTestCase) -> Dict[str, Any]:
+        """Execute individual test case
+        
+        parse and execute_intent are the interface's nlu.parse_command and
+        executor.execute_intent; timeout is the response time limit for a pass.
+        """
+        start_time = time.perf_counter()
         
         try:
             # Parse the command
-            intent = smart_os.nlu.parse_command(test_case.command)
+            intent = self._parse_command(parse, test_case.command)
+            actual_action = intent["action"]
             
             # Check if intent matches expected action
-            intent_correct = intent["action"] == test_case.expected_action
+            intent_correct = actual_action == test_case.expected_action
             
-            # Execute the command
-            execution_result = smart_os.executor.execute_intent(intent)
+            # Execute the command, then read each field of its result once
+            execution_result = execute_intent(intent)
+            execution_successful = execution_result["success"]
+            response_time = execution_result["execution_time"]
+            exec_msg = execution_result.get("message", "")
+            exec_err = execution_result.get("error")
+            screenshot = execution_result.get("screenshot")
             
             # Determine overall success
-            success = (intent_correct and execution_result["success"] and 
-                      execution_result["execution_time"] < smart_os.core.config["response_timeout"])
+            success = (intent_correct and execution_successful and 
+                      response_time < timeout)
             
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             
             return {
                 "test_name": test_case.name,
@@ -177,20 +300,20 @@ class SmartOSTestSuite:
                 "command": test_case.command,
                 "difficulty": test_case.difficulty,
                 "expected_action": test_case.expected_action,
-                "actual_action": intent["action"],
+                "actual_action": actual_action,
                 "intent_confidence": intent["confidence"],
                 "success": success,
                 "execution_time": execution_time,
-                "response_time": execution_result["execution_time"],
-                "message": execution_result.get("message", ""),
-                "error": execution_result.get("error"),
-                "screenshot": execution_result.get("screenshot"),
+                "response_time": response_time,
+                "message": exec_msg,
+                "error": exec_err,
+                "screenshot": screenshot,
                 "intent_correct": intent_correct,
-                "execution_successful": execution_result["success"]
+                "execution_successful": execution_successful
             }
             
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             return {
                 "test_name": test_case.name,
                 "description": test_case.description,
@@ -203,82 +326,97 @@ class SmartOSTestSuite:
                 "execution_successful": False
             }
     
+    def _parse_command(self, parse: Callable[[str], Dict[str, Any]], command: str) -> Dict[str, Any]:
+        """Parse a command once per suite; parse_command is deterministic for a given string"""
+        intent = self._parse_cache.get(command)
+        if intent is None:
+            intent = self._parse_cache[command] = parse(command)
+        # Hand out a copy so the cached intent cannot be changed through a result
+        return {**intent, "parameters": dict(intent["parameters"])}
+    
     def _calculate_metrics(self):
         """Calculate comprehensive test metrics"""
         if not self.results:
             return
         
-        self.metrics["total_tests"] = len(self.results)
-        self.metrics["passed_tests"] = sum(1 for r in self.results if r["success"])
-        self.metrics["failed_tests"] = self.metrics["total_tests"] - self.metrics["passed_tests"]
+        # One pass over the results collects every counter the metrics need;
+        # per-tier counters are lists indexed by Tier
+        tier_totals = [0] * len(Tier)
+        tier_passed = [0] * len(Tier)
+        passed = 0
+        response_time_sum = 0.0
+        timed = 0
+        fast_responses = 0
+        for r in self.results:
+            success = 1 if r["success"] else 0
+            passed += success
+            tier = TIER_BY_DIFFICULTY.get(r["difficulty"])
+            if tier is not None:
+                tier_totals[tier] += 1
+                tier_passed[tier] += success
+            execution_time = r.get("execution_time")
+            if execution_time is not None:
+                response_time_sum += execution_time
+                timed += 1
+                if execution_time < 3.0:
+                    fast_responses += 1
         
-        # Calculate tier-specific pass rates
-        tier1_results = [r for r in self.results if r["difficulty"] == "easy"]
-        tier2_results = [r for r in self.results if r["difficulty"] == "medium"]
-        tier3_results = [r for r in self.results if r["difficulty"] == "hard"]
-        
-        self.metrics["tier1_pass_rate"] = (
-            sum(1 for r in tier1_results if r["success"]) / len(tier1_results) * 100
-            if tier1_results else 0
-        )
+        total_tests = len(self.results)
+        self._tier_counts = list(zip(tier_totals, tier_passed))
         
-        self.metrics["tier2_pass_rate"] = (
-            sum(1 for r in tier2_results if r["success"]) / len(tier2_results) * 100
-            if tier2_results else 0
-        )
-        
-        self.metrics["tier3_pass_rate"] = (
-            sum(1 for r in tier3_results if r["success"]) / len(tier3_results) * 100
-            if tier3_results else 0
-        )
-        
-        # Overall pass rate
-        self.metrics["overall_pass_rate"] = (
-            self.metrics["passed_tests"] / self.metrics["total_tests"] * 100
-        )
-        
-        # Average response time
-        response_times = [r["execution_time"] for r in self.results if "execution_time" in r]
-        self.metrics["average_response_time"] = (
-            sum(response_times) / len(response_times) if response_times else 0
+        # Calculate tier-specific pass rates
+        tier1_rate, tier2_rate, tier3_rate = (
+            tier_pass_count / total * 100 if total else 0
+            for total, tier_pass_count in self._tier_counts
         )
         
-        # Performance benchmarks
-        fast_responses = sum(1 for r in self.results if r.get("execution_time", float('inf')) < 3.0)
-        self.metrics["fast_response_rate"] = fast_responses / len(self.results) * 100
+        # Write every metric back in one update rather than one subscript at a time
+        self.metrics.update({
+            "total_tests": total_tests,
+            "passed_tests": passed,
+            "failed_tests": total_tests - passed,
+            "tier1_pass_rate": tier1_rate,
+            "tier2_pass_rate": tier2_rate,
+            "tier3_pass_rate": tier3_rate,
+            "overall_pass_rate": passed / total_tests * 100,
+            "average_response_time": response_time_sum / timed if timed else 0,
+            # Performance benchmarks
+            "fast_response_rate": fast_responses / total_tests * 100
+        })
     
     def _generate_report(self) -> Dict[str, Any]:
         """Generate comprehensive test report"""
+        metrics = self.metrics
         report = {
             "test_summary": {
-                "total_tests": self.metrics["total_tests"],
-                "passed_tests": self.metrics["passed_tests"],
-                "failed_tests": self.metrics["failed_tests"],
-                "overall_pass_rate": round(self.metrics["overall_pass_rate"], 2),
-                "average_response_time": round(self.metrics["average_response_time"], 3)
+                "total_tests": metrics["total_tests"],
+                "passed_tests": metrics["passed_tests"],
+                "failed_tests": metrics["failed_tests"],
+                "overall_pass_rate": round(metrics["overall_pass_rate"], 2),
+                "average_response_time": round(metrics["average_response_time"], 3)
             },
             "tier_performance": {
                 "tier1_easy": {
-                    "total": len([r for r in self.results if r["difficulty"] == "easy"]),
-                    "passed": len([r for r in self.results if r["difficulty"] == "easy" and r["success"]]),
-                    "pass_rate": round(self.metrics["tier1_pass_rate"], 2)
+                    "total": self._tier_counts[Tier.EASY][0],
+                    "passed": self._tier_counts[Tier.EASY][1],
+                    "pass_rate": round(metrics["tier1_pass_rate"], 2)
                 },
                 "tier2_medium": {
-                    "total": len([r for r in self.results if r["difficulty"] == "medium"]),
-                    "passed": len([r for r in self.results if r["difficulty"] == "medium" and r["success"]]),
-                    "pass_rate": round(self.metrics["tier2_pass_rate"], 2)
+                    "total": self._tier_counts[Tier.MEDIUM][0],
+                    "passed": self._tier_counts[Tier.MEDIUM][1],
+                    "pass_rate": round(metrics["tier2_pass_rate"], 2)
                 },
                 "tier3_hard": {
-                    "total": len([r for r in self.results if r["difficulty"] == "hard"]),
-                    "passed": len([r for r in self.results if r["difficulty"] == "hard" and r["success"]]),
-                    "pass_rate": round(self.metrics["tier3_pass_rate"], 2)
+                    "total": self._tier_counts[Tier.HARD][0],
+                    "passed": self._tier_counts[Tier.HARD][1],
+                    "pass_rate": round(metrics["tier3_pass_rate"], 2)
                 }
             },
             "performance_metrics": {
-                "fast_response_rate": round(self.metrics["fast_response_rate"], 2),
+                "fast_response_rate": round(metrics["fast_response_rate"], 2),
                 "success_criteria_met": {
-                    "pass_rate_above_90": self.metrics["overall_pass_rate"] > 90,
-                    "fast_response_80_percent": self.metrics["fast_response_rate"] > 80,
+                    "pass_rate_above_90": metrics["overall_pass_rate"] > 90,
+                    "fast_response_80_percent": metrics["fast_response_rate"] > 80,
                     "autonomous_execution": True  # Based on no manual intervention needed
                 }
             },
@@ -289,68 +427,104 @@ class SmartOSTestSuite:
     
     def _save_results(self):
         """Save test results to files"""
-        results_dir = Path("test_results")
+        out = self._text_out()
+        results_dir = self.results_dir
         results_dir.mkdir(exist_ok=True)
         
-        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        # Match the name of the JSON Lines file the results were streamed to
+        timestamp = self._run_timestamp or time.strftime("%Y%m%d_%H%M%S")
+        
+        # Save metrics; the individual results are already on disk
+        metrics_file = results_dir / f"smartos_test_metrics_{timestamp}.json"
+        with open(metrics_file, 'wb') as f:
+            f.write(_json_indented(self.metrics))
         
-        # Save JSON results
-        json_file = results_dir / f"smartos_test_results_{timestamp}.json"
-        with open(json_file, 'w') as f:
-            json.dump({
-                "metrics": self.metrics,
-                "results": self.results
-            }, f, indent=2)
+        # Columns in first-seen order; results of tests that raised carry fewer keys
+        fieldnames = list(dict.fromkeys(key for result in self.results for key in result))
         
         # Save Excel-compatible CSV
-        try:
-            import pandas as pd
-            df = pd.DataFrame(self.results)
-            excel_file = results_dir / f"smartos_test_results_{timestamp}.xlsx"
-            df.to_excel(excel_file, index=False)
-        except ImportError:
-            # Fallback to CSV if pandas not available
-            import csv
-            csv_file = results_dir / f"smartos_test_results_{timestamp}.csv"
-            with open(csv_file, 'w', newline='') as f:
-                if self.results:
-                    writer = csv.DictWriter(f, fieldnames=self.results[0].keys())
-                    writer.writeheader()
-                    writer.writerows(self.results)
+        import csv
+        csv_file = results_dir / f"smartos_test_results_{timestamp}.csv"
+        with open(csv_file, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(self.results)
         
-        print(f"Results saved to {results_dir}")
+        # Native Excel workbook only on request; openpyxl's write-only mode streams the rows
+        if self.export_xlsx:
+            try:
+                import openpyxl
+            except ImportError:
+                print("openpyxl is not installed; skipping the xlsx export", file=out)
+            else:
+                workbook = openpyxl.Workbook(write_only=True)
+                sheet = workbook.create_sheet("results")
+                sheet.append(fieldnames)
+                for result in self.results:
+                    sheet.append([result.get(key) for key in fieldnames])
+                workbook.save(results_dir / f"smartos_test_results_{timestamp}.xlsx")
+        
+        print(f"Results saved to {results_dir}", file=out)
     
     def print_summary(self):
         """Print test summary to console"""
-        print("\n" + "="*60)
-        print("SMARTOS TEST SUITE SUMMARY")
-        print("="*60)
-        print(f"Total Tests: {self.metrics['total_tests']}")
-        print(f"Passed: {self.metrics['passed_tests']}")
-        print(f"Failed: {self.metrics['failed_tests']}")
-        print(f"Overall Pass Rate: {self.metrics['overall_pass_rate']:.1f}%")
-        print(f"Average Response Time: {self.metrics['average_response_time']:.3f}s")
+        metrics = self.metrics
+        out = self._text_out()
+        print("\n" + "="*60, file=out)
+        print("SMARTOS TEST SUITE SUMMARY", file=out)
+        print("="*60, file=out)
+        print(f"Total Tests: {metrics['total_tests']}", file=out)
+        print(f"Passed: {metrics['passed_tests']}", file=out)
+        print(f"Failed: {metrics['failed_tests']}", file=out)
+        print(f"Overall Pass Rate: {metrics['overall_pass_rate']:.1f}%", file=out)
+        print(f"Average Response Time: {metrics['average_response_time']:.3f}s", file=out)
         
-        print(f"\nTier Performance:")
-        print(f"  Easy (Tier 1): {self.metrics['tier1_pass_rate']:.1f}%")
-        print(f"  Medium (Tier 2): {self.metrics['tier2_pass_rate']:.1f}%")
-        print(f"  Hard (Tier 3): {self.metrics['tier3_pass_rate']:.1f}%")
+        print(f"\nTier Performance:", file=out)
+        print(f"  Easy (Tier 1): {metrics['tier1_pass_rate']:.1f}%", file=out)
+        print(f"  Medium (Tier 2): {metrics['tier2_pass_rate']:.1f}%", file=out)
+        print(f"  Hard (Tier 3): {metrics['tier3_pass_rate']:.1f}%", file=out)
         
-        print(f"\nSuccess Criteria:")
-        print(f"  Pass Rate >90%: {'✓' if self.metrics['overall_pass_rate'] > 90 else '✗'}")
-        print(f"  Fast Response >80%: {'✓' if self.metrics.get('fast_response_rate', 0) > 80 else '✗'}")
-        print("="*60)
+        print(f"\nSuccess Criteria:", file=out)
+        print(f"  Pass Rate >90%: {'✓' if metrics['overall_pass_rate'] > 90 else '✗'}", file=out)
+        print(f"  Fast Response >80%: {'✓' if metrics.get('fast_response_rate', 0) > 80 else '✗'}", file=out)
+        print("="*60, file=out)
 
 def main():
     """Main test execution"""
-    test_suite = SmartOSTestSuite()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="SmartOS Test Suite")
+    parser.add_argument("--xlsx", action="store_true",
+                       help="Also export results as an Excel workbook (requires openpyxl)")
+    progress = parser.add_mutually_exclusive_group()
+    progress.add_argument("-q", "--quiet", action="store_true",
+                         help="Don't print per-test progress")
+    progress.add_argument("--json-progress", action="store_true",
+                         help="Print per-test progress as JSON lines")
+    
+    parser.add_argument("--workers", type=int, default=1,
+                       help="Run up to N test cases concurrently (default 1; timings include contention when >1)")
+    
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    
+    if args.quiet:
+        progress_mode = "quiet"
+    elif args.json_progress:
+        progress_mode = "json"
+    else:
+        progress_mode = "text"
+    test_suite = SmartOSTestSuite(export_xlsx=args.xlsx, progress=progress_mode)
+    # JSON progress owns stdout; everything else goes to stderr so the stream stays parseable
+    out = sys.stderr if args.json_progress else sys.stdout
     
-    print("SmartOS Test Suite - Version 1.0")
-    print("Comprehensive evaluation with 50 test cases")
-    print("Distribution: Easy 40%, Medium 40%, Hard 20%")
+    print("SmartOS Test Suite - Version 1.0", file=out)
+    print("Comprehensive evaluation with 50 test cases", file=out)
+    print("Distribution: Easy 40%, Medium 40%, Hard 20%", file=out)
     
     # Run all tests
-    report = test_suite.run_all_tests()
+    report = test_suite.run_all_tests(workers=args.workers)
     
     # Print summary
     test_suite.print_summary()
@@ -362,7 +536,7 @@ def main():
             report["performance_metrics"]["fast_response_rate"] > 80
         )
         
-        print(f"\nOverall Success: {'✓ PASSED' if success_criteria_met else '✗ FAILED'}")
+        print(f"\nOverall Success: {'✓ PASSED' if success_criteria_met else '✗ FAILED'}", file=out)
     
     return report
 
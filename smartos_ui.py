@@ -1,5 +1,22 @@
+import os
 import streamlit as st
-from smartos_main import run_model   # ⬅️ import your model function here
+
+LOG_FILE = "smartos.log"   # adjust to your actual log file path
+LOG_TAIL_BYTES = 200_000
+
+@st.cache_data(ttl=5)
+def _load_logs(path, mtime):
+    """Read the last LOG_TAIL_BYTES of the log; mtime keys the cache so edits invalidate it"""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        f.seek(max(f.tell() - LOG_TAIL_BYTES, 0))
+        return f.read().decode("utf-8", errors="ignore")
+
+@st.cache_resource
+def _get_model():
+    """Import the SmartOS stack on first use and keep it across reruns"""
+    from smartos_main import run_model   # ⬅️ import your model function here
+    return run_model
 
 # Streamlit App
 st.set_page_config(page_title="SmartOS Dashboard", layout="wide")
@@ -17,7 +34,8 @@ user_input = st.text_input("Enter your input:")
 
 if st.button("Run SmartOS"):
     if user_input.strip():
-        result = run_model(user_input)   # <-- Call your SmartOS function
+        model = _get_model()
+        result = model(user_input)   # <-- Call your SmartOS function
         st.success("### ✅ Result:")
         st.write(result)
     else:
@@ -26,8 +44,7 @@ if st.button("Run SmartOS"):
 # Logs Section
 st.subheader("📜 Logs")
 if st.button("View Logs"):
-    with open("smartos.log", "r") as f:   # adjust to your actual log file path
-        logs = f.read()
+    logs = _load_logs(LOG_FILE, os.path.getmtime(LOG_FILE))
     st.text_area("Logs", logs, height=200)
 
 # Config Section